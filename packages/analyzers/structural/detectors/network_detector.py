@@ -1,5 +1,5 @@
 import time
-from typing import Dict, List
+from typing import Dict, List, Set
 import networkx as nx
 import numpy as np
 from loguru import logger
@@ -55,7 +55,7 @@ class NetworkDetector(BasePatternDetector):
             List of detected SCC-based pattern dictionaries
         """
         patterns_by_id = {}
-        sccs = list(nx.strongly_connected_components(G))
+        sccs = self._find_sccs(G)
         scc_config = self.config["scc_analysis"]
         
         scc_sizes = [len(scc) for scc in sccs]
@@ -79,9 +79,10 @@ class NetworkDetector(BasePatternDetector):
                 continue
                 
             scc_graph = G.subgraph(scc)
-            total_volume = sum(data['amount_usd_sum'] for _, _, data in scc_graph.edges(data=True))
-            edge_count = scc_graph.number_of_edges()
-            density = nx.density(scc_graph)
+            volumes = [data['amount_usd_sum'] for _, _, data in scc_graph.edges(data=True)]
+            total_volume = sum(volumes)
+            edge_count = len(volumes)
+            density = self._directed_density(edge_count, scc_size)
             
             patterns_by_id[pattern_id] = {
                 'pattern_id': pattern_id,
@@ -101,6 +102,18 @@ class NetworkDetector(BasePatternDetector):
                 
         return list(patterns_by_id.values())
 
+    def _find_sccs(self, G: nx.DiGraph) -> List[Set[str]]:
+        """
+        Find the strongly connected components of the graph.
+        
+        Args:
+            G: NetworkX directed graph to analyze
+            
+        Returns:
+            List of node sets, one per strongly connected component
+        """
+        return list(nx.strongly_connected_components(G))
+
     def _detect_smurfing(self, G: nx.DiGraph) -> List[Dict]:
         """
         Detect smurfing networks using community detection.
@@ -117,6 +130,10 @@ class NetworkDetector(BasePatternDetector):
         min_community_size = network_config["min_community_size"]
         max_community_size = network_config["max_community_size"]
         
+        # No community can reach the minimum size; skip modularity optimization
+        if G.number_of_nodes() < min_community_size:
+            return []
+        
         try:
             G_undirected = G.to_undirected()
             communities = nx.community.greedy_modularity_communities(G_undirected, weight='weight')
@@ -137,9 +154,10 @@ class NetworkDetector(BasePatternDetector):
                     if pattern_id in patterns_by_id:
                         continue
                     
-                    density = nx.density(community_graph)
-                    total_volume = sum(data.get('amount_usd_sum', 0) for _, _, data in community_graph.edges(data=True))
-                    
+                    volumes = [data.get('amount_usd_sum', 0) for _, _, data in community_graph.edges(data=True)]
+                    edge_count = len(volumes)
+                    density = self._directed_density(edge_count, community_size)
+                    total_volume = sum(volumes)
                     
                     hub_addresses = self._identify_hubs_in_network(community_graph)
                     
@@ -154,7 +172,7 @@ class NetworkDetector(BasePatternDetector):
                         'network_density': density,
                         'hub_addresses': hub_addresses,
                         'detection_timestamp': int(time.time()),
-                        'evidence_transaction_count': community_graph.number_of_edges(),
+                        'evidence_transaction_count': edge_count,
                         'evidence_volume_usd': total_volume,
                         'detection_method': DetectionMethods.NETWORK_ANALYSIS
                     }
@@ -164,6 +182,25 @@ class NetworkDetector(BasePatternDetector):
             
         return list(patterns_by_id.values())
 
+    @staticmethod
+    def _directed_density(edge_count: int, node_count: int) -> float:
+        """
+        Density of a directed graph from its edge and node counts.
+        
+        Matches nx.density for a DiGraph without recounting the edges of a
+        subgraph view, which NetworkX does by iterating them.
+        
+        Args:
+            edge_count: Number of edges in the graph
+            node_count: Number of nodes in the graph
+            
+        Returns:
+            Edge count over the n * (n - 1) possible directed edges
+        """
+        if node_count <= 1:
+            return 0.0
+        return edge_count / (node_count * (node_count - 1))
+
     def _is_smurfing_network(self, community_graph: nx.DiGraph) -> bool:
         """
         Determine if a community exhibits smurfing characteristics.
@@ -194,7 +231,7 @@ class NetworkDetector(BasePatternDetector):
         small_tx_ratio = sum(1 for v in volumes if v < small_tx_threshold) / len(volumes)
         
         # High density + small transactions = potential smurfing
-        density = nx.density(community_graph)
+        density = self._directed_density(len(volumes), community_graph.number_of_nodes())
         return small_tx_ratio > small_tx_ratio_threshold and density > density_threshold
 
     def _identify_hubs_in_network(self, community_graph: nx.DiGraph) -> List[str]:
@@ -1,11 +1,12 @@
 import time
+from itertools import chain
 from typing import Dict, List
 import networkx as nx
 from loguru import logger
 
 from packages.analyzers.structural.base_detector import BasePatternDetector
 from chainswarm_core.constants.patterns import PatternTypes, DetectionMethods
-from packages.utils.pattern_utils import generate_pattern_hash, generate_pattern_id
+from packages.utils.pattern_utils import generate_pattern_hashes, generate_pattern_id
 
 
 class ProximityDetector(BasePatternDetector):
@@ -50,15 +51,15 @@ class ProximityDetector(BasePatternDetector):
             
         for risk_addr in risk_addresses:
             try:
-                distances = nx.single_source_shortest_path_length(
-                    G.to_undirected(), risk_addr, cutoff=max_distance
+                distances = self._undirected_distances(G, risk_addr, max_distance)
+                suspects = [address for address, distance in distances.items()
+                            if address != risk_addr and distance != 0]
+                pattern_hashes = generate_pattern_hashes(
+                    PatternTypes.PROXIMITY_RISK, ([risk_addr, address] for address in suspects)
                 )
                 
-                for address, distance in distances.items():
-                    if address == risk_addr or distance == 0:
-                        continue
-                        
-                    pattern_hash = generate_pattern_hash(PatternTypes.PROXIMITY_RISK, [risk_addr, address])
+                for address, pattern_hash in zip(suspects, pattern_hashes):
+                    distance = distances[address]
                     pattern_id = generate_pattern_id(PatternTypes.PROXIMITY_RISK, pattern_hash)
                     
                     if pattern_id in patterns_by_id:
@@ -89,6 +90,38 @@ class ProximityDetector(BasePatternDetector):
                 
         return list(patterns_by_id.values())
 
+    def _undirected_distances(self, G: nx.DiGraph, source: str, cutoff: int) -> Dict[str, int]:
+        """
+        Hop distances from source, ignoring edge direction, up to cutoff.
+        
+        Equivalent to nx.single_source_shortest_path_length on
+        G.to_undirected(), but walks successors and predecessors in place
+        instead of copying the whole graph for every risk address.
+        
+        Args:
+            G: Directed graph to traverse
+            source: Address to measure distances from
+            cutoff: Maximum distance to explore
+            
+        Returns:
+            Dictionary mapping each reachable address to its distance
+        """
+        distances = {source: 0}
+        frontier = [source]
+        
+        for distance in range(1, cutoff + 1):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in chain(G.successors(node), G.predecessors(node)):
+                    if neighbor not in distances:
+                        distances[neighbor] = distance
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+            
+        return distances
+
     def _identify_risk_addresses(self, G: nx.DiGraph) -> List[str]:
         """
         Identify potentially high-risk addresses based on graph metrics.
@@ -44,9 +44,14 @@ class ThresholdDetector(BasePatternDetector):
         
         # Analyze each node for threshold evasion
         for node in G.nodes():
+            # Amounts depend only on the node, so build them once for every threshold
+            transaction_amounts = self._get_transaction_amounts(G, node)
+            if len(transaction_amounts) < min_transactions:
+                continue
+            
             for threshold_type, threshold_value in thresholds.items():
                 evasion_pattern = self._analyze_threshold_evasion(
-                    G, node, threshold_value, threshold_type,
+                    transaction_amounts, threshold_value, threshold_type,
                     min_transactions, clustering_threshold, consistency_threshold
                 )
                 
@@ -114,10 +119,37 @@ class ThresholdDetector(BasePatternDetector):
         
         return thresholds
 
+    def _get_transaction_amounts(self, G: nx.DiGraph, node: str) -> np.ndarray:
+        """
+        Collect estimated individual transaction amounts from a node's outgoing edges.
+        
+        Aggregated edges (tx_count > 1) are expanded into tx_count transactions
+        of amount / tx_count each.
+        
+        Args:
+            G: Graph containing the node
+            node: Address whose outgoing transactions to collect
+            
+        Returns:
+            Float64 array of transaction amounts in edge order
+        """
+        edge_data = [data for _, _, data in G.out_edges(node, data=True)]
+        amounts = np.fromiter(
+            (data.get('amount_usd_sum', 0) for data in edge_data),
+            dtype=np.float64, count=len(edge_data)
+        )
+        tx_counts = np.fromiter(
+            (data.get('tx_count', 1) for data in edge_data),
+            dtype=np.int64, count=len(edge_data)
+        )
+        
+        aggregated = tx_counts > 1
+        per_tx_amounts = np.divide(amounts, tx_counts, out=amounts.copy(), where=aggregated)
+        return np.repeat(per_tx_amounts, np.where(aggregated, tx_counts, 1))
+
     def _analyze_threshold_evasion(
         self,
-        G: nx.DiGraph,
-        node: str,
+        transaction_amounts: np.ndarray,
         threshold: float,
         threshold_type: str,
         min_transactions: int,
@@ -125,11 +157,10 @@ class ThresholdDetector(BasePatternDetector):
         consistency_threshold: float
     ) -> Dict:
         """
-        Analyze a node for threshold evasion patterns.
+        Analyze a node's transaction amounts for threshold evasion patterns.
         
         Args:
-            G: Graph containing the node
-            node: Address to analyze
+            transaction_amounts: Node's outgoing amounts from _get_transaction_amounts
             threshold: Threshold value to check against
             threshold_type: Type of threshold being checked
             min_transactions: Minimum number of near-threshold transactions
@@ -139,41 +170,20 @@ class ThresholdDetector(BasePatternDetector):
         Returns:
             Dictionary with evasion details if detected, None otherwise
         """
-        # Collect transaction amounts from outgoing edges
-        transaction_amounts = []
-        for _, target, data in G.out_edges(node, data=True):
-            amount = data.get('amount_usd_sum', 0)
-            tx_count = data.get('tx_count', 1)
-            
-            # Estimate individual transaction sizes if aggregated
-            if tx_count > 1:
-                avg_amount = amount / tx_count
-                transaction_amounts.extend([avg_amount] * tx_count)
-            else:
-                transaction_amounts.append(amount)
-        
-        if len(transaction_amounts) < min_transactions:
-            return None
-        
         # Define "near threshold" range (e.g., 80-99% of threshold)
         threshold_config = self.config["threshold_detection"]
         near_threshold_lower = threshold * threshold_config.get("near_threshold_lower_pct", 0.80)
         near_threshold_upper = threshold * threshold_config.get("near_threshold_upper_pct", 0.99)
         
-        # Count transactions near the threshold
-        near_threshold_txs = [
-            amt for amt in transaction_amounts
-            if near_threshold_lower <= amt <= near_threshold_upper
-        ]
+        # Select transactions near the threshold
+        near_mask = (transaction_amounts >= near_threshold_lower) & (transaction_amounts <= near_threshold_upper)
+        near_amounts = transaction_amounts[near_mask]
         
-        if len(near_threshold_txs) < min_transactions:
+        if len(near_amounts) < min_transactions:
             return None
         
         # Calculate clustering score (how concentrated are txs near threshold)
-        all_amounts = np.array(transaction_amounts)
-        near_amounts = np.array(near_threshold_txs)
-        
-        clustering_score = len(near_threshold_txs) / len(transaction_amounts)
+        clustering_score = len(near_amounts) / len(transaction_amounts)
         
         if clustering_score < clustering_threshold:
             return None
@@ -190,12 +200,12 @@ class ThresholdDetector(BasePatternDetector):
         
         # Calculate temporal spread (placeholder - would need timestamp data)
         unique_days = 1  # Placeholder
-        avg_daily_transactions = len(near_threshold_txs)  # Placeholder
+        avg_daily_transactions = len(near_amounts)  # Placeholder
         temporal_spread_score = 0.5  # Placeholder
         
         # Return only factual measurements, no composite scoring
         return {
-            'transactions_near_threshold': len(near_threshold_txs),
+            'transactions_near_threshold': len(near_amounts),
             'avg_transaction_size': float(np.mean(near_amounts)),
             'max_transaction_size': float(np.max(near_amounts)),
             'size_consistency': size_consistency,
@@ -1,5 +1,5 @@
 import hashlib
-from typing import List
+from typing import Iterable, List
 
 
 def generate_pattern_hash(pattern_type: str, addresses: List[str]) -> str:
@@ -8,5 +8,16 @@ def generate_pattern_hash(pattern_type: str, addresses: List[str]) -> str:
     return hashlib.sha256(pattern_string.encode()).hexdigest()[:16]
 
 
+def generate_pattern_hashes(pattern_type: str, address_groups: Iterable[List[str]]) -> List[str]:
+    # Same digests as generate_pattern_hash, with the shared prefix hashed once
+    prefix = hashlib.sha256(f"{pattern_type}:".encode())
+    hashes = []
+    for addresses in address_groups:
+        digest = prefix.copy()
+        digest.update(','.join(sorted(addresses)).encode())
+        hashes.append(digest.hexdigest()[:16])
+    return hashes
+
+
 def generate_pattern_id(pattern_type: str, pattern_hash: str) -> str:
     return f"{pattern_type}_{pattern_hash}"
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Shared pytest configuration for the whole test suite.
+
+Command line options are registered here so they are available no matter
+which test directory pytest is started from.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--verbose-pattern-tests",
+        action="store_true",
+        default=False,
+        help="Print pattern detection diagnostics (banners, graph stats, results)"
+    )
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'integration' (require a running ClickHouse)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked 'integration' unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip_integration)
@@ -0,0 +1,43 @@
+"""
+Typed record for burst patterns used by the database storage tests.
+
+Mirrors the analyzers_patterns_burst column schema so a missing or
+misspelled field fails at construction time instead of as a KeyError
+inside the repository. Convert with dataclasses.asdict() at the
+repository boundary.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from chainswarm_core.constants.patterns import PatternTypes
+
+
+@dataclass(frozen=True, slots=True)
+class BurstPatternRecord:
+    """Burst pattern as passed to StructuralPatternRepository.insert_deduplicated_patterns."""
+
+    pattern_id: str
+    pattern_hash: str
+    burst_address: str
+    burst_start_timestamp: int
+    burst_end_timestamp: int
+    burst_duration_seconds: int
+    burst_transaction_count: int
+    burst_volume_usd: float
+    normal_tx_rate: float
+    burst_tx_rate: float
+    burst_intensity: float
+    z_score: float
+    detection_timestamp: int
+    addresses_involved: List[str] = field(default_factory=list)
+    address_roles: List[str] = field(default_factory=list)
+    hourly_distribution: List[int] = field(default_factory=list)
+    peak_hours: List[int] = field(default_factory=list)
+    pattern_type: str = PatternTypes.TEMPORAL_BURST
+    pattern_start_time: int = 0
+    pattern_end_time: int = 0
+    pattern_duration_hours: int = 0
+    evidence_transaction_count: int = 0
+    evidence_volume_usd: float = 0
+    detection_method: str = 'temporal_analysis'
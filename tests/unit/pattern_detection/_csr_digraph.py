@@ -0,0 +1,178 @@
+"""
+Minimal CSR-backed directed graph for motif, proximity and threshold tests.
+
+Stores forward (out) and reverse (in) adjacency as compressed sparse row
+arrays so degree lookups are O(1) and neighbour iteration is a contiguous
+slice, without NetworkX's per-edge attribute dicts.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+import numpy as np
+
+
+def _csr_index(rows: np.ndarray, n_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(row_ptr, order)`` grouping edges by ``rows``."""
+    order = np.argsort(rows, kind='stable')
+    row_ptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_nodes), out=row_ptr[1:])
+    return row_ptr, order
+
+
+def _gather(row_ptr: np.ndarray, col_idx: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Concatenate the column slices of ``rows`` without a Python loop."""
+    starts = row_ptr[rows]
+    counts = row_ptr[rows + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return col_idx[:0]
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+    return col_idx[offsets]
+
+
+def bfs_distances(adjacency: Sequence[Tuple[np.ndarray, np.ndarray]],
+                  sources: np.ndarray, n_nodes: int, max_distance: int) -> np.ndarray:
+    """
+    Level-synchronous BFS over one or more CSR adjacencies.
+    
+    Each level gathers the whole frontier's neighbours in one vectorized
+    step. Returns an int32 array of hop distances (-1 where unreached).
+    """
+    dist = np.full(n_nodes, -1, dtype=np.int32)
+    frontier = np.unique(sources)
+    dist[frontier] = 0
+    for distance in range(1, max_distance + 1):
+        neighbours = np.concatenate([_gather(row_ptr, col_idx, frontier) for row_ptr, col_idx in adjacency])
+        frontier = np.unique(neighbours[dist[neighbours] < 0])
+        if not len(frontier):
+            break
+        dist[frontier] = distance
+    return dist
+
+
+class CSRDiGraph:
+    """
+    Read-only directed graph over named nodes backed by CSR arrays.
+
+    Implements only the ``nx.DiGraph`` surface the motif, proximity and
+    threshold detectors touch: ``nodes``, ``in_degree``/``out_degree``,
+    ``predecessors``/``successors`` and ``in_edges``/``out_edges``
+    (optionally with edge data).
+    """
+
+    __slots__ = ('_names', '_index', '_out', '_in')
+
+    def __init__(self, names: Sequence[str],
+                 out_row_ptr: np.ndarray, out_col_idx: np.ndarray,
+                 out_amount: np.ndarray, out_tx_count: np.ndarray,
+                 in_row_ptr: np.ndarray, in_col_idx: np.ndarray,
+                 in_amount: np.ndarray, in_tx_count: np.ndarray):
+        self._names = list(names)
+        self._index = {name: i for i, name in enumerate(self._names)}
+        self._out = (out_row_ptr, out_col_idx, out_amount, out_tx_count)
+        self._in = (in_row_ptr, in_col_idx, in_amount, in_tx_count)
+
+    @classmethod
+    def from_edges(cls, names: Sequence[str], src: np.ndarray, dst: np.ndarray,
+                   amount: np.ndarray, tx_count: np.ndarray) -> 'CSRDiGraph':
+        """
+        Build from parallel edge arrays over integer ids into ``names``.
+
+        Mirrors ``nx.DiGraph.add_edges_from``: a repeated ``(src, dst)`` pair
+        keeps its last attributes, and ids without edges are not nodes.
+        """
+        n = len(names)
+        key = src.astype(np.int64) * n + dst
+        _, last = np.unique(key[::-1], return_index=True)
+        keep = np.sort(len(key) - 1 - last)
+        src, dst, amount, tx_count = src[keep], dst[keep], amount[keep], tx_count[keep]
+
+        used = np.unique(np.concatenate([src, dst]))
+        remap = np.full(n, -1, dtype=np.int64)
+        remap[used] = np.arange(len(used))
+        src, dst = remap[src], remap[dst]
+
+        out_row_ptr, out_order = _csr_index(src, len(used))
+        in_row_ptr, in_order = _csr_index(dst, len(used))
+        return cls(
+            [names[i] for i in used.tolist()],
+            out_row_ptr, dst[out_order], amount[out_order], tx_count[out_order],
+            in_row_ptr, src[in_order], amount[in_order], tx_count[in_order],
+        )
+
+    @classmethod
+    def from_edge_list(cls, edges: Iterable[Tuple[str, str, float, int]]) -> 'CSRDiGraph':
+        """
+        Build from ``(u, v, amount_usd_sum, tx_count)`` tuples over names.
+
+        Node ids are assigned in first-seen order, so ``nodes()`` matches a
+        DiGraph built from the same edges. Intended for small fixed fixtures.
+        """
+        index: Dict[str, int] = {}
+        src, dst, amount, tx_count = [], [], [], []
+        for u, v, amt, txc in edges:
+            src.append(index.setdefault(u, len(index)))
+            dst.append(index.setdefault(v, len(index)))
+            amount.append(amt)
+            tx_count.append(txc)
+        return cls.from_edges(
+            list(index), np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64),
+            np.array(amount, dtype=np.float64), np.array(tx_count, dtype=np.int64),
+        )
+
+    def nodes(self) -> List[str]:
+        return list(self._names)
+
+    def number_of_nodes(self) -> int:
+        return len(self._names)
+
+    def number_of_edges(self) -> int:
+        return int(self._out[0][-1])
+
+    def _slice(self, adj: tuple, v: str) -> slice:
+        i = self._index[v]
+        return slice(int(adj[0][i]), int(adj[0][i + 1]))
+
+    def in_degree(self, v: str) -> int:
+        s = self._slice(self._in, v)
+        return s.stop - s.start
+
+    def out_degree(self, v: str) -> int:
+        s = self._slice(self._out, v)
+        return s.stop - s.start
+
+    def predecessors(self, v: str) -> Iterator[str]:
+        return (self._names[j] for j in self._in[1][self._slice(self._in, v)].tolist())
+
+    def successors(self, v: str) -> Iterator[str]:
+        return (self._names[j] for j in self._out[1][self._slice(self._out, v)].tolist())
+
+    def _edges(self, adj: tuple, v: str, data: bool, reverse: bool) -> Iterator[tuple]:
+        s = self._slice(adj, v)
+        cols = adj[1][s].tolist()
+        amounts = adj[2][s].tolist()
+        tx_counts = adj[3][s].tolist()
+        for j, amount, tx_count in zip(cols, amounts, tx_counts):
+            edge = (self._names[j], v) if reverse else (v, self._names[j])
+            if data:
+                attrs: Dict = {'amount_usd_sum': amount, 'tx_count': tx_count}
+                yield edge + (attrs,)
+            else:
+                yield edge
+
+    def undirected_distances(self, source: str, cutoff: int) -> Dict[str, int]:
+        """
+        Hop distances from ``source`` ignoring direction, up to ``cutoff``.
+        
+        Drop-in for ProximityDetector._undirected_distances, walking the
+        out and in arrays together with ``bfs_distances``.
+        """
+        sources = np.array([self._index[source]], dtype=np.int64)
+        dist = bfs_distances([self._out[:2], self._in[:2]], sources, len(self._names), cutoff)
+        reached = np.flatnonzero(dist >= 0)
+        return {self._names[i]: d for i, d in zip(reached.tolist(), dist[reached].tolist())}
+
+    def in_edges(self, v: str, data: bool = False) -> Iterator[tuple]:
+        return self._edges(self._in, v, data, reverse=True)
+
+    def out_edges(self, v: str, data: bool = False) -> Iterator[tuple]:
+        return self._edges(self._out, v, data, reverse=False)
@@ -0,0 +1,14 @@
+"""
+Diagnostic output helpers shared by the pattern detection tests.
+
+Banners are drawn with the rules below and printed through conftest's
+``log`` fixture, which is ``silent`` unless --verbose-pattern-tests is given.
+"""
+
+HEAVY_RULE = '=' * 80
+HASH_RULE = '#' * 80
+
+
+def silent(*args, **kwargs):
+    """Discard diagnostic output."""
+    return None
@@ -0,0 +1,567 @@
+"""
+Seeded graph generators shared by the pattern detection tests.
+
+Motif, proximity and threshold graphs are built here, away from the
+test modules, so the CSR parity test can reuse them without importing
+other test modules. The seeded_* wrappers cache one graph per argument
+tuple; detectors only read the graph, so callers share it.
+"""
+
+import functools
+import networkx as nx
+import numpy as np
+from typing import List, Tuple
+from tests.unit.pattern_detection._csr_digraph import CSRDiGraph
+from tests.unit.pattern_detection._diagnostics import HEAVY_RULE, silent
+from tests.unit.pattern_detection._seeding import stable_seed
+
+
+_NODE_NAMES = {}
+
+
+def _node_names(prefix: str, n: int) -> List[str]:
+    """
+    Return ``[prefix_0000, ..., prefix_{n-1}]`` from a per-prefix table.
+    
+    The table only grows, so repeated generator calls slice names that were
+    formatted once instead of re-formatting them.
+    """
+    names = _NODE_NAMES.setdefault(prefix, [])
+    if len(names) < n:
+        names.extend(["%s_%04d" % (prefix, i) for i in range(len(names), n)])
+    return names[:n]
+
+
+def _empty_edge_arrays(n_edges: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Preallocate (src, dst, amount, tx_count) arrays for ``n_edges`` edges."""
+    src = np.empty(n_edges, dtype=np.int32)
+    dst = np.empty(n_edges, dtype=np.int32)
+    amt = np.empty(n_edges, dtype=np.float64)
+    txc = np.ones(n_edges, dtype=np.int32)
+    return src, dst, amt, txc
+
+
+def _graph_from_edge_arrays(id2name: List[str], src: np.ndarray, dst: np.ndarray,
+                            amt: np.ndarray, txc: np.ndarray, noise_start: int,
+                            use_csr: bool = False) -> Tuple[nx.DiGraph, list]:
+    """
+    Wrap fully built edge arrays in a DiGraph with a single bulk insert.
+    
+    Integer node ids are mapped to names only here. Edges from ``noise_start``
+    onwards are returned as ``(from, to, amount)`` noise tuples. With
+    ``use_csr`` the arrays back a ``CSRDiGraph`` and NetworkX is skipped.
+    """
+    src_names = [id2name[i] for i in src.tolist()]
+    dst_names = [id2name[i] for i in dst.tolist()]
+    amounts = amt.tolist()
+    noise_edges = list(zip(src_names[noise_start:], dst_names[noise_start:], amounts[noise_start:]))
+    if use_csr:
+        return CSRDiGraph.from_edges(id2name, src, dst, amt, txc), noise_edges
+    G = nx.DiGraph()
+    G.add_edges_from(
+        (u, v, {'amount_usd_sum': a, 'tx_count': t})
+        for u, v, a, t in zip(src_names, dst_names, amounts, txc.tolist())
+    )
+    return G, noise_edges
+
+
+def generate_fanin_motif_with_noise(num_sources: int, noise_ratio: float = 0.01, seed: int = None,
+                                    use_csr: bool = False, log=None) -> Tuple[nx.DiGraph, dict]:
+    """
+    Generate a fan-in motif pattern with noise transactions.
+    
+    Args:
+        num_sources: Number of source nodes sending to center (5, 10, 20, 50)
+        noise_ratio: Ratio of noise transactions to motif transactions
+        seed: Generator seed (defaults to one derived from kind, size and noise_ratio)
+        use_csr: Return a CSRDiGraph built from the edge arrays instead of a DiGraph
+        log: Diagnostic printer (silent by default)
+    
+    Returns:
+        Tuple of (graph, metadata) where metadata contains:
+            - center_address: The aggregation point
+            - source_addresses: List of source nodes
+            - fanin_volume: Total incoming volume
+            - in_degree: Number of sources
+            - noise_edges: List of noise edges
+    """
+    log = log or silent
+    log("\n%s", HEAVY_RULE)
+    log("🔧 GENERATING FAN-IN MOTIF: sources=%s, noise_ratio=%s", num_sources, noise_ratio)
+    log("%s", HEAVY_RULE)
+    
+    rng = np.random.default_rng(stable_seed("fanin", num_sources, noise_ratio) if seed is None else seed)
+    
+    # Generate center and source nodes
+    center = "CENTER_FANIN"
+    sources = _node_names("SOURCE", num_sources)
+    log("📍 Center: %s", center)
+    log("📍 Sources: %s nodes", len(sources))
+    
+    num_noise_edges = int(len(sources) * noise_ratio)
+    noise_nodes = _node_names("NOISE", max(2, num_noise_edges)) if num_noise_edges > 0 else []
+    
+    # Integer ids: sources, center, output, then noise nodes
+    id2name = sources + [center, "OUTPUT_1"] + noise_nodes
+    center_id = num_sources
+    noise_ids = np.arange(num_sources + 2, len(id2name))
+    src, dst, amt, txc = _empty_edge_arrays(num_sources + 1 + num_noise_edges)
+    
+    # Create fan-in edges
+    base_amount = 10000  # Base amount in USD
+    src[:num_sources] = np.arange(num_sources)
+    dst[:num_sources] = center_id
+    amt[:num_sources] = base_amount * rng.uniform(0.8, 1.2, num_sources)
+    txc[:num_sources] = rng.integers(1, 4, num_sources)
+    total_fanin_volume = float(amt[:num_sources].sum())
+    
+    log("💰 Fan-in edges: %s edges, total volume: $%.2f", len(sources), total_fanin_volume)
+    
+    # Add minimal outgoing edge from center (to avoid fan-out detection)
+    src[num_sources], dst[num_sources], amt[num_sources] = center_id, center_id + 1, 5000
+    
+    if num_noise_edges > 0:
+        log("🔊 Adding noise: %s noise edges", num_noise_edges)
+        # Candidate pool for resampled endpoints is built once, not per edge
+        candidates = np.concatenate([noise_ids, np.arange(min(2, num_sources))])
+        idx = noise_ids[rng.integers(0, len(noise_ids), size=(num_noise_edges, 2))]
+        collisions = idx[:, 0] == idx[:, 1]
+        idx[collisions, 1] = candidates[rng.integers(0, len(candidates), collisions.sum())]
+        src[num_sources + 1:] = idx[:, 0]
+        dst[num_sources + 1:] = idx[:, 1]
+        amt[num_sources + 1:] = base_amount * rng.uniform(0.1, 0.5, num_noise_edges)
+    
+    G, noise_edges = _graph_from_edge_arrays(id2name, src, dst, amt, txc, num_sources + 1, use_csr)
+    
+    log("📊 Graph stats:")
+    log("   Total nodes: %s", G.number_of_nodes())
+    log("   Total edges: %s", G.number_of_edges())
+    log("   Center in-degree: %s", G.in_degree(center))
+    log("   Center out-degree: %s", G.out_degree(center))
+    
+    metadata = {
+        'center_address': center,
+        'source_addresses': sources,
+        'fanin_volume': total_fanin_volume,
+        'in_degree': len(sources),
+        'noise_edges': noise_edges,
+        'num_sources': num_sources
+    }
+    
+    return G, metadata
+
+
+def generate_fanout_motif_with_noise(num_destinations: int, noise_ratio: float = 0.01, seed: int = None,
+                                     use_csr: bool = False, log=None) -> Tuple[nx.DiGraph, dict]:
+    """
+    Generate a fan-out motif pattern with noise transactions.
+    
+    Args:
+        num_destinations: Number of destination nodes receiving from center
+        noise_ratio: Ratio of noise transactions to motif transactions
+        seed: Generator seed (defaults to one derived from kind, size and noise_ratio)
+        use_csr: Return a CSRDiGraph built from the edge arrays instead of a DiGraph
+        log: Diagnostic printer (silent by default)
+    
+    Returns:
+        Tuple of (graph, metadata) where metadata contains:
+            - center_address: The distribution point
+            - destination_addresses: List of destination nodes
+            - fanout_volume: Total outgoing volume
+            - out_degree: Number of destinations
+            - noise_edges: List of noise edges
+    """
+    log = log or silent
+    log("\n%s", HEAVY_RULE)
+    log("🔧 GENERATING FAN-OUT MOTIF: destinations=%s, noise_ratio=%s", num_destinations, noise_ratio)
+    log("%s", HEAVY_RULE)
+    
+    rng = np.random.default_rng(stable_seed("fanout", num_destinations, noise_ratio) if seed is None else seed)
+    
+    # Generate center and destination nodes
+    center = "CENTER_FANOUT"
+    destinations = _node_names("DEST", num_destinations)
+    log("📍 Center: %s", center)
+    log("📍 Destinations: %s nodes", len(destinations))
+    
+    num_noise_edges = int(len(destinations) * noise_ratio)
+    noise_nodes = _node_names("NOISE", max(2, num_noise_edges)) if num_noise_edges > 0 else []
+    
+    # Integer ids: destinations, center, input, then noise nodes
+    id2name = destinations + [center, "INPUT_1"] + noise_nodes
+    center_id = num_destinations
+    noise_ids = np.arange(num_destinations + 2, len(id2name))
+    src, dst, amt, txc = _empty_edge_arrays(num_destinations + 1 + num_noise_edges)
+    
+    # Create fan-out edges
+    base_amount = 10000  # Base amount in USD
+    src[:num_destinations] = center_id
+    dst[:num_destinations] = np.arange(num_destinations)
+    amt[:num_destinations] = base_amount * rng.uniform(0.8, 1.2, num_destinations)
+    txc[:num_destinations] = rng.integers(1, 4, num_destinations)
+    total_fanout_volume = float(amt[:num_destinations].sum())
+    
+    log("💰 Fan-out edges: %s edges, total volume: $%.2f", len(destinations), total_fanout_volume)
+    
+    # Add minimal incoming edge to center (to avoid fan-in detection)
+    src[num_destinations], dst[num_destinations], amt[num_destinations] = center_id + 1, center_id, 5000
+    
+    if num_noise_edges > 0:
+        log("🔊 Adding noise: %s noise edges", num_noise_edges)
+        # Candidate pool for resampled endpoints is built once, not per edge
+        candidates = np.concatenate([noise_ids, np.arange(min(2, num_destinations))])
+        idx = noise_ids[rng.integers(0, len(noise_ids), size=(num_noise_edges, 2))]
+        collisions = idx[:, 0] == idx[:, 1]
+        idx[collisions, 1] = candidates[rng.integers(0, len(candidates), collisions.sum())]
+        src[num_destinations + 1:] = idx[:, 0]
+        dst[num_destinations + 1:] = idx[:, 1]
+        amt[num_destinations + 1:] = base_amount * rng.uniform(0.1, 0.5, num_noise_edges)
+    
+    G, noise_edges = _graph_from_edge_arrays(id2name, src, dst, amt, txc, num_destinations + 1, use_csr)
+    
+    log("📊 Graph stats:")
+    log("   Total nodes: %s", G.number_of_nodes())
+    log("   Total edges: %s", G.number_of_edges())
+    log("   Center in-degree: %s", G.in_degree(center))
+    log("   Center out-degree: %s", G.out_degree(center))
+    
+    metadata = {
+        'center_address': center,
+        'destination_addresses': destinations,
+        'fanout_volume': total_fanout_volume,
+        'out_degree': len(destinations),
+        'noise_edges': noise_edges,
+        'num_destinations': num_destinations
+    }
+    
+    return G, metadata
+
+
+_MOTIF_GENERATORS = {
+    'in': generate_fanin_motif_with_noise,
+    'out': generate_fanout_motif_with_noise,
+}
+
+
+
+@functools.lru_cache(maxsize=None)
+def seeded_motif(kind: str, n: int, noise_ratio: float, seed: int = None,
+                 use_csr: bool = False) -> Tuple[nx.DiGraph, dict]:
+    """Build a reproducible noisy motif once per argument tuple."""
+    return _MOTIF_GENERATORS[kind](n, noise_ratio, seed=seed, use_csr=use_csr)
+
+
+# Noise edges per risk edge; the parametrized stress cases use the maximum
+MAX_NOISE_RATIO = 10
+
+
+def generate_proximity_graph_with_noise(
+    max_distance: int,
+    addresses_per_distance: int = 3,
+    noise_ratio: float = 0.01,
+    seed: int = None,
+    use_csr: bool = False,
+    log=None
+) -> Tuple[nx.DiGraph, dict]:
+    """
+    Generate a proximity graph with addresses at various distances from risk source.
+    
+    Edges are written into preallocated integer-id arrays (risk source = 0,
+    then each distance level in order, then noise nodes) and wrapped in a
+    graph once at the end.
+    
+    Args:
+        max_distance: Maximum hops from risk source (3, 4, 5, 6)
+        addresses_per_distance: Number of addresses at each distance level
+        noise_ratio: Noise edges per risk edge, from 0 to MAX_NOISE_RATIO
+            (0.01 adds one per hundred risk edges, 10 adds ten per risk edge)
+        seed: Generator seed (defaults to max_distance)
+        use_csr: Return a CSRDiGraph over the edge arrays instead of a DiGraph
+        log: Diagnostic printer (silent by default)
+    
+    Returns:
+        Tuple of (graph, metadata) where metadata contains:
+            - risk_address: The risk source address
+            - addresses_by_distance: Dict[distance -> List[addresses]]
+            - expected_propagation_scores: Dict[address -> score]
+            - total_addresses: Total non-noise addresses
+    """
+    if not 0 <= noise_ratio <= MAX_NOISE_RATIO:
+        raise ValueError(f"noise_ratio must be between 0 and {MAX_NOISE_RATIO}, got {noise_ratio}")
+    
+    log = log or silent
+    log("\n%s", HEAVY_RULE)
+    log("🔧 GENERATING PROXIMITY GRAPH: max_distance=%s, nodes_per_level=%s", max_distance, addresses_per_distance)
+    log("%s", HEAVY_RULE)
+    
+    rng = np.random.default_rng(seed if seed is not None else max_distance)
+    
+    # Risk source
+    risk_address = "RISK_SOURCE"
+    
+    # Total risk-related edges: one incoming edge per non-risk address
+    total_edges = max_distance * addresses_per_distance
+    num_noise_edges = int(total_edges * noise_ratio)
+    num_noise_nodes = max(3, num_noise_edges) if num_noise_edges > 0 else 0
+    
+    # Integer ids: risk source, distance levels in order, then noise nodes
+    id2name = [risk_address]
+    src = np.empty(total_edges + num_noise_edges, dtype=np.int32)
+    dst = np.empty(total_edges + num_noise_edges, dtype=np.int32)
+    amt = np.empty(total_edges + num_noise_edges, dtype=np.float32)
+    txc = np.ones(total_edges + num_noise_edges, dtype=np.int32)
+    
+    # Build layered graph: RISK -> D1 -> D2 -> ... -> Dn
+    addresses_by_distance = {}
+    base_amount = 50000
+    
+    # Generate addresses at each distance level; each level's ids are contiguous
+    previous_level = np.zeros(1, dtype=np.int32)
+    
+    for distance in range(1, max_distance + 1):
+        level = slice((distance - 1) * addresses_per_distance, distance * addresses_per_distance)
+        current_level = np.arange(level.start + 1, level.stop + 1, dtype=np.int32)
+        id2name.extend(f"DIST_{distance}_ADDR_{i:03d}" for i in range(addresses_per_distance))
+        
+        # Connect each address to a random node from previous level
+        src[level] = previous_level[rng.integers(0, len(previous_level), addresses_per_distance)]
+        dst[level] = current_level
+        amt[level] = base_amount * rng.uniform(0.8, 1.2, addresses_per_distance)
+        txc[level] = rng.integers(1, 4, addresses_per_distance)
+        
+        addresses_by_distance[distance] = id2name[level.start + 1:level.stop + 1]
+        previous_level = current_level
+        
+        log("📍 Distance %s: %s addresses", distance, len(current_level))
+    
+    # Calculate expected propagation scores
+    # Formula: distance_decay_factor / (distance + 1)
+    # Using default decay factor of 1.0
+    decay_factor = 1.0
+    level_scores = decay_factor / (np.arange(1, max_distance + 1) + 1)
+    # Ids 1..total_edges are the distance-level addresses in level order
+    expected_propagation_scores = dict(zip(
+        id2name[1:total_edges + 1],
+        np.repeat(level_scores, addresses_per_distance).tolist()
+    ))
+    
+    # Add noise edges
+    noise_edges = []
+    
+    if num_noise_edges > 0:
+        log("🔊 Adding %s noise edges", num_noise_edges)
+        noise_start = len(id2name)
+        noise_ids = np.arange(num_noise_nodes).astype(str)
+        id2name.extend(np.char.add("NOISE_", np.char.zfill(noise_ids, 4)).tolist())
+        
+        # Shift self-loop targets to the next noise node instead of redrawing
+        from_idx = rng.integers(0, num_noise_nodes, num_noise_edges)
+        to_idx = rng.integers(0, num_noise_nodes, num_noise_edges)
+        collisions = from_idx == to_idx
+        to_idx[collisions] = (to_idx[collisions] + 1) % num_noise_nodes
+        
+        src[total_edges:] = noise_start + from_idx
+        dst[total_edges:] = noise_start + to_idx
+        amt[total_edges:] = base_amount * rng.uniform(0.2, 0.8, num_noise_edges)
+        
+        noise_edges = [(id2name[u], id2name[v]) for u, v in zip(src[total_edges:].tolist(), dst[total_edges:].tolist())]
+    
+    if use_csr:
+        G = CSRDiGraph.from_edges(id2name, src, dst, amt, txc)
+    else:
+        G = nx.DiGraph()
+        G.add_edges_from(
+            (id2name[u], id2name[v], {'amount_usd_sum': a, 'tx_count': t})
+            for u, v, a, t in zip(src.tolist(), dst.tolist(), amt.tolist(), txc.tolist())
+        )
+    
+    total_addresses = sum(len(addrs) for addrs in addresses_by_distance.values())
+    
+    log("📊 Graph stats:")
+    log("   Total nodes: %s", G.number_of_nodes())
+    log("   Total edges: %s", G.number_of_edges())
+    log("   Risk source: %s", risk_address)
+    log("   Addresses by distance: %s", total_addresses)
+    log("   Noise edges: %s", len(noise_edges))
+    
+    metadata = {
+        'risk_address': risk_address,
+        'addresses_by_distance': addresses_by_distance,
+        'expected_propagation_scores': expected_propagation_scores,
+        'total_addresses': total_addresses,
+        'max_distance': max_distance,
+        'noise_edges': noise_edges
+    }
+    
+    return G, metadata
+
+
+@functools.lru_cache(maxsize=32)
+def seeded_proximity(max_distance: int, addresses_per_distance: int, noise_ratio: float,
+                     seed: int, use_csr: bool = False) -> Tuple[nx.DiGraph, dict]:
+    """Build a reproducible proximity graph once per argument tuple."""
+    return generate_proximity_graph_with_noise(
+        max_distance, addresses_per_distance=addresses_per_distance,
+        noise_ratio=noise_ratio, seed=seed, use_csr=use_csr
+    )
+
+
+def _draw_threshold_amounts(rng: np.random.Generator, num_transactions: int, threshold: float,
+                            clustering: float) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Draw all evader amounts and their summary stats in NumPy batches.
+    
+    int(num_transactions * clustering) amounts cluster at 88-96% of the
+    threshold; the rest are either much lower (10-60%) or above it
+    (120-200%), with equal odds. Returns (near_amounts, random_amounts,
+    mean of near_amounts, coefficient of variation of near_amounts).
+    """
+    num_near_threshold = int(num_transactions * clustering)
+    num_random = num_transactions - num_near_threshold
+    
+    near_amounts = threshold * rng.uniform(0.88, 0.96, num_near_threshold)
+    lower = rng.random(num_random) < 0.5
+    random_amounts = threshold * np.where(
+        lower,
+        rng.uniform(0.1, 0.6, num_random),
+        rng.uniform(1.2, 2.0, num_random),
+    )
+    
+    avg = near_amounts.mean()
+    return near_amounts, random_amounts, avg, near_amounts.std() / max(avg, 1.0)
+
+
+def generate_threshold_evasion_pattern(
+    num_transactions: int,
+    threshold: float = 10000,
+    clustering: float = 0.8,
+    noise_ratio: float = 0.01,
+    seed: int = None,
+    use_csr: bool = False,
+    log=None
+) -> Tuple[nx.DiGraph, dict]:
+    """
+    Generate a threshold evasion pattern.
+    
+    Args:
+        num_transactions: Number of near-threshold transactions
+        threshold: Reporting threshold (e.g., $10,000)
+        clustering: Ratio of transactions near threshold (0.7-0.95)
+        noise_ratio: Noise edges per evader transaction (a multiplier, as in
+            the other pattern generators; 5 adds five per transaction)
+        seed: Generator seed (defaults to one derived from the other arguments)
+        use_csr: Return a CSRDiGraph over the same edges instead of a DiGraph
+        log: Diagnostic printer (silent by default)
+    
+    Returns:
+        Tuple of (graph, metadata) where metadata contains:
+            - primary_address: The evading address
+            - near_threshold_txs: Count of transactions near threshold
+            - avg_tx_size: Average transaction size
+            - clustering_score: Computed clustering score
+            - size_consistency: Computed consistency
+            - threshold_value: The threshold being evaded
+    """
+    log = log or silent
+    log("\n%s", HEAVY_RULE)
+    log("🔧 GENERATING THRESHOLD EVASION: %s txs, threshold=$%.0f", num_transactions, threshold)
+    log("%s", HEAVY_RULE)
+    
+    rng = np.random.default_rng(
+        stable_seed(num_transactions, threshold, clustering, noise_ratio) if seed is None else seed
+    )
+    
+    # (source, target, amount_usd_sum, tx_count), wrapped in a graph at the end
+    edges = []
+    
+    # Primary address doing the evasion
+    primary = "EVADER_001"
+    
+    # Calculate near-threshold range (80-99% of threshold)
+    near_threshold_lower = threshold * 0.80
+    near_threshold_upper = threshold * 0.99
+    
+    # Generate near-threshold transactions
+    num_near_threshold = int(num_transactions * clustering)
+    
+    log("📊 Target range: $%.0f - $%.0f", near_threshold_lower, near_threshold_upper)
+    log("   Near-threshold txs: %s", num_near_threshold)
+    
+    # Near-threshold amounts cluster tightly around 88-96% of threshold;
+    # the random ones are either much lower or above it
+    near_threshold_amounts, random_amounts, avg_tx_size, cv = _draw_threshold_amounts(
+        rng, num_transactions, threshold, clustering
+    )
+    
+    edges.extend((primary, f"DEST_{i:04d}", amount, 1)
+                 for i, amount in enumerate(near_threshold_amounts.tolist()))
+    edges.extend((primary, f"RANDOM_{i:04d}", amount, 1)
+                 for i, amount in enumerate(random_amounts.tolist()))
+    
+    # Calculate statistics
+    total_generated = len(near_threshold_amounts) + len(random_amounts)
+    
+    # Clustering score
+    actual_clustering = len(near_threshold_amounts) / max(total_generated, 1)
+    
+    # Size consistency (inverse of CV)
+    size_consistency = max(0, 1.0 - cv)
+    
+    log("💰 Generated transactions:")
+    log("   Total: %s", total_generated)
+    log("   Near threshold: %s", len(near_threshold_amounts))
+    log("   Avg near-threshold: $%.2f", avg_tx_size)
+    log("   Clustering score: %.3f", actual_clustering)
+    log("   Size consistency: %.3f", size_consistency)
+    log("   CV: %.3f", cv)
+    
+    # Add noise edges
+    num_noise = int(total_generated * noise_ratio)
+    if num_noise > 0:
+        log("🔊 Adding %s noise transactions", num_noise)
+        noise_ids = np.arange(max(2, num_noise)).astype(str)
+        noise_nodes = tuple(np.char.add("NOISE_", np.char.zfill(noise_ids, 4)).tolist())
+        noise_amounts = threshold * rng.uniform(0.1, 1.5, num_noise)
+        # A non-zero offset (mod n) keeps every target distinct from its source
+        from_idx = rng.integers(0, len(noise_nodes), num_noise)
+        to_idx = (from_idx + rng.integers(1, len(noise_nodes), num_noise)) % len(noise_nodes)
+        edges.extend(
+            (noise_nodes[u], noise_nodes[v], amount, 1)
+            for u, v, amount in zip(from_idx.tolist(), to_idx.tolist(), noise_amounts.tolist())
+        )
+    
+    if use_csr:
+        G = CSRDiGraph.from_edge_list(edges)
+    else:
+        G = nx.DiGraph()
+        G.add_edges_from(
+            (u, v, {'amount_usd_sum': amount, 'tx_count': tx_count})
+            for u, v, amount, tx_count in edges
+        )
+    
+    log("📊 Graph stats:")
+    log("   Total nodes: %s", G.number_of_nodes())
+    log("   Total edges: %s", G.number_of_edges())
+    
+    metadata = {
+        'primary_address': primary,
+        'near_threshold_txs': len(near_threshold_amounts),
+        'avg_tx_size': avg_tx_size,
+        'clustering_score': actual_clustering,
+        'size_consistency': size_consistency,
+        'threshold_value': threshold,
+        'num_transactions': num_transactions
+    }
+    
+    return G, metadata
+
+
+@functools.lru_cache(maxsize=None)
+def seeded_threshold(num_transactions: int, threshold: float, clustering: float,
+                     noise_ratio: float, seed: int = None,
+                     use_csr: bool = False) -> Tuple[nx.DiGraph, dict]:
+    """Build a reproducible threshold evasion graph once per argument tuple."""
+    return generate_threshold_evasion_pattern(
+        num_transactions, threshold=threshold, clustering=clustering,
+        noise_ratio=noise_ratio, seed=seed, use_csr=use_csr
+    )
@@ -0,0 +1,15 @@
+"""
+Seeding helpers shared by the pattern detection tests.
+"""
+
+import zlib
+
+
+def stable_seed(*parts) -> int:
+    """
+    Seed derived from parts that is stable across runs and processes.
+
+    Uses crc32 rather than hash(), which is salted per process and would
+    give different graphs across runs and xdist workers.
+    """
+    return zlib.crc32(":".join(str(part) for part in parts).encode())
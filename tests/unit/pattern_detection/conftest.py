@@ -3,9 +3,29 @@ Pytest configuration for pattern detection unit tests.
 
 These fixtures provide test context without external dependencies.
 All tests use mocks for repositories and synthetic graph data.
+
+Diagnostic output is silent by default; pass --verbose-pattern-tests
+(together with -s) to see it.
 """
 
+import io
+import os
+import random
+import sys
+from collections import defaultdict
+
 import pytest
+import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+from packages.utils import calculate_time_window
+from packages.analyzers.structural.structural_pattern_analyzer import StructuralPatternAnalyzer
+from packages.storage.repositories.structural_pattern_repository import StructuralPatternRepository
+from packages.storage.repositories.money_flows_repository import MoneyFlowsRepository
+from packages.storage.repositories.address_label_repository import AddressLabelRepository
+from tests.unit.pattern_detection._diagnostics import silent
+from tests.unit.pattern_detection._seeding import stable_seed
 
 # Test parameters - same as integration tests for consistency
 TEST_NETWORK = "torus"
@@ -24,4 +44,158 @@ def test_data_context():
         'network': TEST_NETWORK,
         'processing_date': TEST_PROCESSING_DATE,
         'window_days': TEST_WINDOW_DAYS
-    }
\ No newline at end of file
+    }
+
+
+def _print(msg, *args):
+    """Print diagnostic output, applying %-style args only when printing."""
+    print(msg % args if args else msg)
+
+
+@pytest.fixture(autouse=True)
+def _quiet_stdout(monkeypatch):
+    """
+    Send stdout to an in-memory sink when QUIET_TESTS=1.
+    
+    Catches any remaining direct print() calls in test helpers without
+    touching them; costs nothing when the variable is unset.
+    """
+    if os.getenv("QUIET_TESTS") == "1":
+        monkeypatch.setattr(sys, 'stdout', io.StringIO())
+
+
+@pytest.fixture(autouse=True)
+def _deterministic_rng(request):
+    """
+    Seed random and NumPy from the test's node id.
+    
+    Each test sees the same random stream on every run and every xdist
+    worker.
+    """
+    seed = stable_seed(request.node.nodeid)
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+@pytest.fixture(scope="session")
+def verbose_pattern_tests(request):
+    """Whether --verbose-pattern-tests diagnostics are enabled."""
+    return request.config.getoption("--verbose-pattern-tests")
+
+
+@pytest.fixture(scope="session")
+def log(verbose_pattern_tests):
+    """
+    Diagnostic printer for pattern detection tests.
+    
+    Returns a printer when --verbose-pattern-tests is given, otherwise a
+    no-op, so default runs skip the stdout I/O entirely. Pass expensive
+    values as %-style args (log("found %s", n)) so they are only
+    formatted when printing.
+    """
+    if verbose_pattern_tests:
+        return _print
+    return silent
+
+
+def _scc_via_scipy(G):
+    """
+    Strongly connected components as node sets, via scipy's csgraph.
+    
+    Drop-in for NetworkDetector._find_sccs: runs the compiled SCC pass on
+    a CSR copy of G instead of NetworkX's pure-Python traversal.
+    """
+    nodes = list(G)
+    if not nodes:
+        return []
+    csr = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+    _, labels = connected_components(csr, directed=True, connection='strong')
+    components = defaultdict(set)
+    for node, label in zip(nodes, labels.tolist()):
+        components[label].add(node)
+    return list(components.values())
+
+
+@pytest.fixture(scope="session")
+def scc_via_scipy():
+    """SCC finder backed by scipy, for patching over NetworkDetector._find_sccs."""
+    return _scc_via_scipy
+
+
+class _NullRepo:
+    """
+    Repository stand-in whose methods are no-ops.
+    
+    Only names defined on repo_class resolve, so a misspelled repository
+    method fails with AttributeError instead of passing silently.
+    """
+    
+    def __init__(self, repo_class):
+        self._repo_class = repo_class
+    
+    def __getattr__(self, name):
+        if not hasattr(self._repo_class, name):
+            raise AttributeError(f"{self._repo_class.__name__} has no attribute {name!r}")
+        return silent
+
+
+def _install_null_hooks(analyzer) -> None:
+    """Point the analyzer's graph and label hooks at empty stand-ins."""
+    analyzer._build_graph_from_flows_data = lambda flows: nx.DiGraph()
+    analyzer._extract_addresses_from_flows = lambda flows: []
+    analyzer._load_address_labels = silent
+
+
+def wire(analyzer, G):
+    """Point the analyzer's graph hooks at G and return the analyzer."""
+    # Addresses are only read downstream, so a tuple built once is safe to share
+    nodes = tuple(G.nodes())
+    analyzer._build_graph_from_flows_data = lambda _flows, _G=G: _G
+    analyzer._extract_addresses_from_flows = lambda _flows, _n=nodes: _n
+    return analyzer
+
+
+@pytest.fixture(scope="module")
+def analyzer(test_data_context):
+    """
+    StructuralPatternAnalyzer with null repositories, shared per test module.
+    
+    Detectors keep no state between detect() calls, so one instance can be
+    reused. Graph-independent overrides are wired here; tests point
+    _build_graph_from_flows_data / _extract_addresses_from_flows at their
+    own graph.
+    """
+    start_ts, end_ts = calculate_time_window(
+        test_data_context['window_days'],
+        test_data_context['processing_date']
+    )
+    
+    analyzer = StructuralPatternAnalyzer(
+        money_flows_repository=_NullRepo(MoneyFlowsRepository),
+        pattern_repository=_NullRepo(StructuralPatternRepository),
+        address_label_repository=_NullRepo(AddressLabelRepository),
+        window_days=test_data_context['window_days'],
+        start_timestamp=start_ts,
+        end_timestamp=end_ts,
+        network=test_data_context['network']
+    )
+    
+    _install_null_hooks(analyzer)
+    
+    return analyzer
+
+
+@pytest.fixture(autouse=True)
+def _reset_analyzer_hooks(request):
+    """
+    Reinstall the shared analyzer's null hooks after each test that used it.
+    
+    Tests point the graph hooks at their own graph (and some stub label
+    loading), so one test's overrides would otherwise leak into the next.
+    """
+    if 'analyzer' not in request.fixturenames:
+        yield
+        return
+    analyzer = request.getfixturevalue('analyzer')
+    yield
+    _install_null_hooks(analyzer)
@@ -17,19 +17,22 @@ both the expected behavior with timestamps and the current limitation.
 Enhanced with:
 - Tests for both with and without timestamp data
 - Mock timestamp data generation
+- Kleinberg burst reference for the injected burst window
 - Parametrized tests
-- Debug console output
+- Debug console output (enable with --verbose-pattern-tests)
 """
 
 import pytest
 import time
-import random
 import networkx as nx
+import numpy as np
 from typing import Tuple, List
+from chainswarm_core.constants.patterns import PatternTypes
 from packages.analyzers.structural.structural_pattern_analyzer import StructuralPatternAnalyzer
 from packages.storage.repositories.structural_pattern_repository import StructuralPatternRepository
 from packages.storage.repositories.money_flows_repository import MoneyFlowsRepository
 from packages.storage.repositories.address_label_repository import AddressLabelRepository
+from tests.unit.pattern_detection._diagnostics import HASH_RULE, HEAVY_RULE, silent
 
 
 def create_graph_without_timestamps() -> nx.DiGraph:
@@ -45,247 +48,331 @@ def create_graph_without_timestamps() -> nx.DiGraph:
     return G
 
 
-def create_graph_with_mock_timestamps() -> Tuple[nx.DiGraph, dict]:
+def build_burst_graph(
+    normal_rate: int,
+    burst_rate: int,
+    burst_hours: int,
+    n_edges: int,
+    duration_hours: int = 24,
+    burst_start_hour: int = 10,
+    seed: int = 0,
+    log=silent
+) -> Tuple[nx.DiGraph, dict]:
     """
-    Create a graph WITH mock timestamp data.
+    Create a graph WITH mock timestamp data for a burst scenario.
     This demonstrates what the detector WOULD do with proper data.
     
+    Transactions arrive at normal_rate tx/hour for duration_hours, except
+    for burst_hours starting at burst_start_hour where they arrive at
+    burst_rate tx/hour. The timestamps are spread over n_edges outgoing
+    edges of a single burst address.
+    
+    Args:
+        normal_rate: Transactions per hour outside the burst
+        burst_rate: Transactions per hour during the burst
+        burst_hours: Length of the burst in hours
+        n_edges: Number of outgoing edges carrying the timestamps
+        duration_hours: Total simulated period in hours
+        burst_start_hour: Hour offset at which the burst begins
+        seed: Seed for the amount generator
+        log: Diagnostic printer (silent by default)
+    
     Returns:
         Tuple of (graph, metadata) with burst information
     """
-    print(f"\n{'='*80}")
-    print(f"🔧 GENERATING GRAPH WITH MOCK TIMESTAMPS")
-    print(f"{'='*80}")
+    log("\n%s", HEAVY_RULE)
+    log("🔧 GENERATING GRAPH WITH MOCK TIMESTAMPS")
+    log("%s", HEAVY_RULE)
     
+    rng = np.random.default_rng(seed)
     G = nx.DiGraph()
     
-    # Create burst scenario:
-    # - Normal period: 10 tx/hour
-    # - Burst period: 50 tx/hour (5x intensity)
-    
     burst_address = "BURSTER_001"
+    burst_end_hour = burst_start_hour + burst_hours
     
-    # Simulate 24 hours of transactions
-    base_time = int(time.time()) - (24 * 3600)  # 24 hours ago
+    # Simulate duration_hours of transactions
+    base_time = int(time.time()) - (duration_hours * 3600)
     
-    # Normal period (hours 0-10): 10 tx/hour
-    normal_timestamps = []
-    for hour in range(10):
-        for tx in range(10):
-            timestamp = base_time + (hour * 3600) + (tx * 360)  # Spread across hour
-            normal_timestamps.append(timestamp)
+    def hourly_timestamps(first_hour: int, last_hour: int, rate: int) -> np.ndarray:
+        """Timestamps spread evenly across each hour, monotone by construction."""
+        hours = np.arange(first_hour, last_hour)[:, None] * 3600
+        offsets = np.arange(rate)[None, :] * (3600 // rate)
+        return (base_time + hours + offsets).ravel()
     
-    # Burst period (hours 10-12): 50 tx/hour
-    burst_timestamps = []
-    for hour in range(10, 12):
-        for tx in range(50):
-            timestamp = base_time + (hour * 3600) + (tx * 72)  # More frequent
-            burst_timestamps.append(timestamp)
-    
-    # Normal period again (hours 12-24): 10 tx/hour  
-    for hour in range(12, 24):
-        for tx in range(10):
-            timestamp = base_time + (hour * 3600) + (tx * 360)
-            normal_timestamps.append(timestamp)
-    
-    # Create edges with timestamp arrays
-    # Aggregate into fewer edges for graph representation
-    total_timestamps = sorted(normal_timestamps + burst_timestamps)
+    # Normal period, burst period, normal period again - already globally sorted
+    total_timestamps = np.concatenate([
+        hourly_timestamps(0, burst_start_hour, normal_rate),
+        hourly_timestamps(burst_start_hour, burst_end_hour, burst_rate),
+        hourly_timestamps(burst_end_hour, duration_hours, normal_rate),
+    ])
     
     # Add edge with timestamps attribute
-    for i in range(10):
+    for i in range(n_edges):
         dest = f"DEST_{i:03d}"
         # Each edge gets a portion of timestamps
-        edge_timestamps = total_timestamps[i::10]
-        amounts = [random.uniform(5000, 15000) for _ in edge_timestamps]
-        total_amount = sum(amounts)
+        edge_timestamps = total_timestamps[i::n_edges]
+        total_amount = float(rng.uniform(5000, 15000, len(edge_timestamps)).sum())
         
         G.add_edge(
             burst_address,
             dest,
             amount_usd_sum=total_amount,
             tx_count=len(edge_timestamps),
-            timestamps=edge_timestamps  # KEY: timestamp data
+            timestamps=edge_timestamps.tolist()  # KEY: timestamp data
         )
     
-    print(f"📊 Graph stats:")
-    print(f"   Total nodes: {G.number_of_nodes()}")
-    print(f"   Total edges: {G.number_of_edges()}")
-    print(f"   Total timestamps: {len(total_timestamps)}")
-    print(f"   Normal tx rate: ~10/hour")
-    print(f"   Burst tx rate: ~50/hour")
-    print(f"   Burst intensity: ~5x")
+    burst_intensity = burst_rate / normal_rate
+    
+    log("📊 Graph stats:")
+    log("   Total nodes: %s", G.number_of_nodes())
+    log("   Total edges: %s", G.number_of_edges())
+    log("   Total timestamps: %s", len(total_timestamps))
+    log("   Normal tx rate: ~%s/hour", normal_rate)
+    log("   Burst tx rate: ~%s/hour", burst_rate)
+    log("   Burst intensity: ~%.1fx", burst_intensity)
     
     metadata = {
         'burst_address': burst_address,
-        'normal_tx_rate': 10,
-        'burst_tx_rate': 50,
-        'burst_intensity': 5.0,
-        'burst_duration_hours': 2,
+        'normal_tx_rate': normal_rate,
+        'burst_tx_rate': burst_rate,
+        'burst_intensity': burst_intensity,
+        'burst_duration_hours': burst_hours,
+        'burst_start_timestamp': base_time + burst_start_hour * 3600,
+        'burst_end_timestamp': base_time + burst_end_hour * 3600,
         'total_timestamps': len(total_timestamps)
     }
     
     return G, metadata
 
 
+def kleinberg_bursts(timestamps: np.ndarray, s: float = 2.0, gamma: float = 1.0) -> List[Tuple[int, int, int]]:
+    """
+    Reference two-state Kleinberg burst detection over a timestamp stream.
+    
+    Inter-arrival gaps are modelled as exponential with the base rate
+    (state 0) or s times the base rate (state 1); the cheapest state
+    sequence is found with a Viterbi pass where entering the burst state
+    costs gamma * ln(n).
+    
+    Args:
+        timestamps: Sorted Unix timestamps
+        s: Rate multiplier of the burst state
+        gamma: Cost weight for entering the burst state
+    
+    Returns:
+        List of (start_timestamp, end_timestamp, level) burst intervals
+    """
+    timestamps = np.asarray(timestamps, dtype=float)
+    gaps = np.diff(timestamps)
+    n = len(gaps)
+    if n < 2 or timestamps[-1] <= timestamps[0]:
+        return []
+    
+    base_rate = n / (timestamps[-1] - timestamps[0])
+    rates = np.array([base_rate, s * base_rate])
+    
+    # Cost of each gap in each state: -ln(rate * exp(-rate * gap))
+    emission = rates[None, :] * gaps[:, None] - np.log(rates)[None, :]
+    # Moving up into the burst state costs gamma * ln(n), moving down is free
+    transition = np.array([[0.0, gamma * np.log(n)], [0.0, 0.0]])
+    
+    cost = np.array([0.0, np.inf])
+    back = np.zeros((n, 2), dtype=np.intp)
+    for t in range(n):
+        total = cost[:, None] + transition
+        back[t] = np.argmin(total, axis=0)
+        cost = total[back[t], [0, 1]] + emission[t]
+    
+    states = np.empty(n, dtype=np.intp)
+    states[-1] = int(np.argmin(cost))
+    for t in range(n - 1, 0, -1):
+        states[t - 1] = back[t, states[t]]
+    
+    # Collapse runs of the burst state into intervals
+    run_edges = np.flatnonzero(np.diff(np.concatenate(([0], states, [0]))))
+    return [
+        (int(timestamps[start]), int(timestamps[end]), 1)
+        for start, end in zip(run_edges[::2], run_edges[1::2])
+    ]
+
+
+def reference_burst_window(G: nx.DiGraph) -> Tuple[int, int]:
+    """Longest Kleinberg burst over all edge timestamps in G, as (start, end)."""
+    all_timestamps = np.sort(np.concatenate([data['timestamps'] for _, _, data in G.edges(data=True)]))
+    reference_bursts = kleinberg_bursts(all_timestamps)
+    assert reference_bursts, "Reference should find the injected burst"
+    ref_start, ref_end, _ = max(reference_bursts, key=lambda b: b[1] - b[0])
+    return ref_start, ref_end
+
+
 class TestBurstDetection:
-    """Test temporal burst pattern detection."""
+    """
+    Test temporal burst pattern detection.
     
-    @pytest.fixture
-    def analyzer(self, test_data_context):
-        """Create StructuralPatternAnalyzer instance with mock repos."""
-        from unittest.mock import Mock
-        from packages.utils import calculate_time_window
-        from packages.analyzers.structural import StructuralPatternAnalyzer
-        
-        start_ts, end_ts = calculate_time_window(
-            test_data_context['window_days'],
-            test_data_context['processing_date']
-        )
+    Uses the module-scoped analyzer from conftest; tests patch its graph
+    hooks via monkeypatch.
+    """
+    
+    def test_timestamp_precondition_without_timestamps(self, analyzer, log):
+        """
+        Test that the detector's timestamp precondition rejects graphs without timestamps.
         
-        # Create mock repositories
-        mock_money_flows = Mock()
-        mock_pattern_repo = Mock()
-        mock_label_repo = Mock()
-        
-        analyzer = StructuralPatternAnalyzer(
-            money_flows_repository=mock_money_flows,
-            pattern_repository=mock_pattern_repo,
-            address_label_repository=mock_label_repo,
-            window_days=test_data_context['window_days'],
-            start_timestamp=start_ts,
-            end_timestamp=end_ts,
-            network=test_data_context['network']
-        )
+        Cheap check of the guard that makes detect() return an empty list.
+        """
+        G = create_graph_without_timestamps()
         
-        return analyzer
+        assert not analyzer.burst_detector._has_timestamp_data(G), \
+            "Test graph should not have timestamps"
+        log("   ✓ Graph confirmed to have no timestamp data")
     
-    def test_no_detection_without_timestamps(self, analyzer):
+    @pytest.mark.slow
+    def test_no_detection_without_timestamps(self, analyzer, log, monkeypatch):
         """
         Test that burst detection returns empty list without timestamp data.
         
         This is the CURRENT expected behavior and documents the limitation.
+        Runs the full detect() path; the fast precondition check is
+        test_timestamp_precondition_without_timestamps.
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: No Detection Without Timestamps (Current Limitation)")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: No Detection Without Timestamps (Current Limitation)")
+        log("%s", HASH_RULE)
         
         G = create_graph_without_timestamps()
         
-        # Verify graph has NO timestamp data
-        has_timestamps = False
-        for u, v, data in G.edges(data=True):
-            if 'timestamps' in data or 'timestamp' in data:
-                has_timestamps = True
-                break
-        
-        assert not has_timestamps, "Test graph should not have timestamps"
-        print(f"   ✓ Graph confirmed to have no timestamp data")
-        
         # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
+        monkeypatch.setattr(analyzer, '_build_graph_from_flows_data', lambda flows: G)
+        monkeypatch.setattr(analyzer, '_extract_addresses_from_flows', lambda flows: list(G.nodes()))
+        monkeypatch.setattr(analyzer, '_load_address_labels', lambda addrs: None)
         
         # Get burst detector
         burst_detector = analyzer.burst_detector
         
         # Run detection
-        print(f"\n🔍 Running burst detection...")
+        log("\n🔍 Running burst detection...")
         patterns = burst_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Should return empty list without timestamps
         assert len(patterns) == 0, \
             "Burst detector should return empty list without timestamp data"
-        print(f"   ✓ Correctly returns empty list without timestamps")
+        log("   ✓ Correctly returns empty list without timestamps")
         
-        print(f"\n{'='*80}")
-        print(f"✅ TEST PASSED: No detection without timestamps (as expected)")
-        print(f"{'='*80}\n")
+        log("\n%s", HEAVY_RULE)
+        log("✅ TEST PASSED: No detection without timestamps (as expected)")
+        log("%s\n", HEAVY_RULE)
     
-    def test_burst_detection_with_mock_timestamps(self, analyzer):
+    @pytest.mark.parametrize("normal_rate,burst_rate,burst_hours,n_edges", [
+        (10, 50, 2, 10),
+        (5, 100, 1, 20),
+        (20, 80, 4, 5),
+    ], ids=["5x_2h", "20x_1h", "4x_4h"])
+    def test_burst_detection_with_mock_timestamps(self, analyzer, log, monkeypatch,
+                                                  normal_rate, burst_rate, burst_hours, n_edges):
         """
         Test burst detection WITH mock timestamp data.
         
         This documents what WOULD happen with proper timestamp data.
         NOTE: This test may not work with current implementation.
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Burst Detection With Mock Timestamps (Future Feature)")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Burst Detection With Mock Timestamps (Future Feature)")
+        log("%s", HASH_RULE)
         
-        G, metadata = create_graph_with_mock_timestamps()
+        G, metadata = build_burst_graph(normal_rate, burst_rate, burst_hours, n_edges, log=log)
         
         # Verify graph HAS timestamp data
-        has_timestamps = False
-        for u, v, data in G.edges(data=True):
-            if 'timestamps' in data or 'timestamp' in data:
-                has_timestamps = True
-                print(f"   ✓ Found timestamp data on edge {u}->{v}")
-                break
+        assert analyzer.burst_detector._has_timestamp_data(G), "Test graph should have timestamps"
+        log("   ✓ Found timestamp data on edges")
         
-        assert has_timestamps, "Test graph should have timestamps"
+        # The Kleinberg reference must recover the injected burst window
+        ref_start, ref_end = reference_burst_window(G)
+        log("   Reference burst: %s -> %s", ref_start, ref_end)
+        
+        assert abs(ref_start - metadata['burst_start_timestamp']) <= 3600
+        assert abs(ref_end - metadata['burst_end_timestamp']) <= 3600
+        log("   ✓ Reference burst matches injected window")
         
         # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
+        monkeypatch.setattr(analyzer, '_build_graph_from_flows_data', lambda flows: G)
+        monkeypatch.setattr(analyzer, '_extract_addresses_from_flows', lambda flows: list(G.nodes()))
+        monkeypatch.setattr(analyzer, '_load_address_labels', lambda addrs: None)
         
         # Get burst detector
         burst_detector = analyzer.burst_detector
         
         # Run detection
-        print(f"\n🔍 Running burst detection...")
+        log("\n🔍 Running burst detection...")
         try:
             patterns = burst_detector.detect(G)
             
-            print(f"📋 Detected {len(patterns)} pattern(s)")
+            log("📋 Detected %s pattern(s)", len(patterns))
             
             # If implementation is complete, verify patterns
             if len(patterns) > 0:
                 pattern = patterns[0]
                 
-                print(f"\n  Pattern details:")
-                print(f"    Type: {pattern.get('pattern_type', 'N/A')}")
-                print(f"    Burst Address: {pattern.get('burst_address', 'N/A')}")
-                print(f"    Intensity: {pattern.get('burst_intensity', 0):.2f}")
-                print(f"    Duration: {pattern.get('burst_duration_seconds', 0)}s")
-                print(f"    Normal rate: {pattern.get('normal_tx_rate', 0):.2f}")
-                print(f"    Burst rate: {pattern.get('burst_tx_rate', 0):.2f}")
+                log("\n  Pattern details:")
+                log("    Type: %s", pattern.get('pattern_type', 'N/A'))
+                log("    Burst Address: %s", pattern.get('burst_address', 'N/A'))
+                log("    Intensity: %.2f", pattern.get('burst_intensity', 0))
+                log("    Duration: %ss", pattern.get('burst_duration_seconds', 0))
+                log("    Normal rate: %.2f", pattern.get('normal_tx_rate', 0))
+                log("    Burst rate: %.2f", pattern.get('burst_tx_rate', 0))
                 
                 # Verify pattern type
-                assert pattern['pattern_type'] == 'temporal_burst'
-                print(f"   ✓ Pattern type correct")
+                assert pattern['pattern_type'] == PatternTypes.TEMPORAL_BURST
+                log("   ✓ Pattern type correct")
                 
                 # Verify intensity
                 assert pattern['burst_intensity'] >= 3.0, "Burst intensity should be ≥ 3.0"
-                print(f"   ✓ Burst intensity ≥ 3.0")
+                log("   ✓ Burst intensity ≥ 3.0")
                 
-                print(f"\n✅ TEST PASSED: Burst detection with timestamps working!")
+                log("\n✅ TEST PASSED: Burst detection with timestamps working!")
             else:
-                print(f"\n   ℹ No patterns detected")
-                print(f"   ℹ This is expected if burst analysis is not fully implemented")
-                print(f"   ℹ Test documents the expected behavior")
+                log("\n   ℹ No patterns detected")
+                log("   ℹ This is expected if burst analysis is not fully implemented")
+                log("   ℹ Test documents the expected behavior")
         
         except NotImplementedError as e:
-            print(f"\n   ℹ Burst detection not fully implemented: {e}")
-            print(f"   ℹ This test documents the expected interface")
+            log("\n   ℹ Burst detection not fully implemented: %s", e)
+            log("   ℹ This test documents the expected interface")
+        
+        log("\n%s", HEAVY_RULE)
+        log("✅ TEST COMPLETED: Burst detection interface documented")
+        log("%s\n", HEAVY_RULE)
+    
+    @pytest.mark.xfail(
+        reason="BurstDetector._analyze_temporal_bursts is a skeleton that returns None",
+        strict=True,
+    )
+    def test_detector_burst_matches_kleinberg_reference(self, analyzer):
+        """
+        The strongest detected burst lines up with the Kleinberg reference (±1h).
+        
+        Pending the real _analyze_temporal_bursts; strict, so it starts
+        failing as XPASS once the detector reports bursts.
+        """
+        G, _ = build_burst_graph(10, 50, 2, 10)
+        ref_start, ref_end = reference_burst_window(G)
+        
+        patterns = analyzer.burst_detector.detect(G)
         
-        print(f"\n{'='*80}")
-        print(f"✅ TEST COMPLETED: Burst detection interface documented")
-        print(f"{'='*80}\n")
+        assert patterns, "Detector reported no bursts"
+        strongest = max(patterns, key=lambda p: p['burst_intensity'])
+        assert abs(strongest['burst_start_timestamp'] - ref_start) <= 3600
+        assert abs(strongest['burst_end_timestamp'] - ref_end) <= 3600
     
-    def test_burst_intensity_calculation(self, analyzer):
+    def test_burst_intensity_calculation(self, analyzer, log):
         """
         Test burst intensity calculation (when implemented).
         
         Intensity = burst_tx_rate / normal_tx_rate
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Burst Intensity Calculation (Interface Documentation)")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Burst Intensity Calculation (Interface Documentation)")
+        log("%s", HASH_RULE)
         
         # Expected calculation:
         # If normal rate = 10 tx/hour and burst rate = 50 tx/hour
@@ -295,39 +382,58 @@ class TestBurstDetection:
         burst_rate = 50.0
         expected_intensity = burst_rate / normal_rate
         
-        print(f"   Normal rate: {normal_rate} tx/hour")
-        print(f"   Burst rate: {burst_rate} tx/hour")
-        print(f"   Expected intensity: {expected_intensity}x")
+        log("   Normal rate: %s tx/hour", normal_rate)
+        log("   Burst rate: %s tx/hour", burst_rate)
+        log("   Expected intensity: %sx", expected_intensity)
         
         assert expected_intensity == 5.0
-        print(f"   ✓ Intensity formula verified: {expected_intensity}x")
+        log("   ✓ Intensity formula verified: %sx", expected_intensity)
         
-        print(f"\n✅ TEST PASSED: Intensity calculation documented")
+        log("\n✅ TEST PASSED: Intensity calculation documented")
     
-    def test_burst_z_score_calculation(self, analyzer):
+    def test_burst_z_score_calculation(self, analyzer, log):
         """
         Test z-score calculation for statistical significance.
         
         Z-score indicates how many standard deviations the burst
-        is from the normal transaction rate.
+        is from the normal transaction rate. The reference uses a robust
+        baseline (median centering, 10%-90% quantile spread) so the burst
+        hours themselves do not inflate the estimated spread.
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Z-Score Calculation (Interface Documentation)")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Z-Score Calculation (Robust Reference)")
+        log("%s", HASH_RULE)
         
         # Expected: z-score ≥ 2.0 for detection
-        min_z_score = 2.0
+        min_z_score = analyzer.config['burst_detection'].get('z_score_threshold', 2.0)
+        
+        # Hourly transaction counts: ~10 tx/hour with a 2-hour ~50 tx/hour burst
+        rng = np.random.default_rng(0)
+        counts = rng.poisson(10, 24)
+        burst_hours = [10, 11]
+        counts[burst_hours] = rng.poisson(50, len(burst_hours))
+        
+        # Robust z-score: 2.56 = distance between N(0,1) 10% and 90% quantiles
+        q10, med, q90 = np.percentile(counts, [10, 50, 90])
+        robust_sigma = (q90 - q10) / 2.56
+        assert robust_sigma > 0
+        z = (counts - med) / robust_sigma
+        
+        log("   Minimum z-score threshold: %s", min_z_score)
+        log("   Median: %s, robust sigma: %.2f", med, robust_sigma)
+        log("   Burst hour z-scores: %s", z[burst_hours].round(2).tolist())
         
-        print(f"   Minimum z-score threshold: {min_z_score}")
-        print(f"   ✓ Threshold documented")
+        assert (z[burst_hours] >= min_z_score).all(), "Burst hours should exceed z-score threshold"
+        assert int(np.argmax(z)) in burst_hours, "Peak z-score should fall in the burst window"
+        log("   ✓ Burst hours exceed z-score threshold")
         
-        print(f"\n✅ TEST PASSED: Z-score threshold documented")
+        log("\n✅ TEST PASSED: Z-score threshold verified")
     
-    def test_burst_deduplication(self, analyzer):
+    def test_burst_deduplication(self, analyzer, log):
         """Test that burst patterns would be deduplicated correctly."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Burst Deduplication (Interface Documentation)")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Burst Deduplication (Interface Documentation)")
+        log("%s", HASH_RULE)
         
         G = create_graph_without_timestamps()
         
@@ -339,18 +445,18 @@ class TestBurstDetection:
         
         # Should return consistent results
         assert len(patterns1) == len(patterns2)
-        print(f"   ✓ Consistent results: {len(patterns1)} patterns")
+        log("   ✓ Consistent results: %s patterns", len(patterns1))
         
-        print(f"\n✅ TEST PASSED: Deduplication interface verified")
+        log("\n✅ TEST PASSED: Deduplication interface verified")
     
-    def test_burst_properties_structure(self, analyzer):
+    def test_burst_properties_structure(self, analyzer, log):
         """
         Test the expected structure of burst pattern properties.
         Documents the interface for future implementation.
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Burst Properties Structure (Interface Documentation)")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Burst Properties Structure (Interface Documentation)")
+        log("%s", HASH_RULE)
         
         # Expected properties for a burst pattern
         expected_properties = [
@@ -371,13 +477,13 @@ class TestBurstDetection:
             'peak_hours'
         ]
         
-        print(f"\n   Expected burst pattern properties:")
+        log("\n   Expected burst pattern properties:")
         for prop in expected_properties:
-            print(f"      - {prop}")
+            log("      - %s", prop)
         
-        print(f"\n   ✓ Interface documented: {len(expected_properties)} properties")
+        log("\n   ✓ Interface documented: %s properties", len(expected_properties))
         
-        print(f"\n✅ TEST PASSED: Burst pattern interface documented")
+        log("\n✅ TEST PASSED: Burst pattern interface documented")
 
 
 # Note: Additional documentation for future implementation
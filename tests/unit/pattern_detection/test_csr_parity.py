@@ -0,0 +1,103 @@
+"""
+Parity tests for the CSRDiGraph shim.
+
+Each detector that accepts the shim must report the same patterns on a
+CSRDiGraph as on the NetworkX DiGraph built from the same seeded
+generator arguments.
+"""
+
+import functools
+import pytest
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+from tests.unit.pattern_detection._generators import (
+    MAX_NOISE_RATIO,
+    seeded_motif,
+    seeded_proximity,
+    seeded_threshold,
+)
+
+
+@dataclass(frozen=True)
+class _ParityCase:
+    """
+    One detector/graph pairing to check on both graph backends.
+
+    build(use_csr=...) returns (graph, metadata). prepare runs before both
+    detections; prepare_csr runs only before the CSR one, for overrides
+    that need the shim's API.
+    """
+
+    detector: str
+    build: Callable[..., Tuple]
+    exact_fields: Tuple[str, ...]
+    approx_fields: Tuple[str, ...]
+    prepare: Optional[Callable] = None
+    prepare_csr: Optional[Callable] = None
+
+
+def _target_proximity_risk(detector, metadata, monkeypatch):
+    """Seed the generated risk source and search all six generated levels."""
+    monkeypatch.setattr(detector, '_identify_risk_addresses', lambda G: [metadata['risk_address']])
+    monkeypatch.setitem(detector.config['proximity_analysis'], 'max_distance', 6)
+
+
+def _use_numpy_bfs(detector, monkeypatch):
+    """Route the proximity BFS through the shim's vectorized bfs_distances kernel."""
+    monkeypatch.setattr(detector, '_undirected_distances',
+                        lambda G, source, cutoff: G.undirected_distances(source, cutoff))
+
+
+_PROXIMITY = dict(
+    detector='proximity_detector',
+    build=functools.partial(seeded_proximity, 6, 3, MAX_NOISE_RATIO, 6),
+    exact_fields=('distance_to_risk', 'evidence_transaction_count'),
+    approx_fields=('evidence_volume_usd',),
+    prepare=_target_proximity_risk,
+)
+
+_CASES = {
+    'motif_fanin': _ParityCase(
+        detector='motif_detector',
+        build=functools.partial(seeded_motif, 'in', 20, 10),
+        exact_fields=('motif_center_address',),
+        approx_fields=('evidence_volume_usd',),
+    ),
+    'motif_fanout': _ParityCase(
+        detector='motif_detector',
+        build=functools.partial(seeded_motif, 'out', 20, 10),
+        exact_fields=('motif_center_address',),
+        approx_fields=('evidence_volume_usd',),
+    ),
+    'proximity_detector_bfs': _ParityCase(**_PROXIMITY),
+    'proximity_numpy_bfs': _ParityCase(**_PROXIMITY, prepare_csr=_use_numpy_bfs),
+    'threshold': _ParityCase(
+        detector='threshold_detector',
+        build=functools.partial(seeded_threshold, 20, 10000, 0.85, 5),
+        exact_fields=('transactions_near_threshold',),
+        approx_fields=('avg_transaction_size', 'size_consistency'),
+    ),
+}
+
+
+@pytest.mark.parametrize("case", list(_CASES.values()), ids=list(_CASES))
+def test_csr_graph_matches_networkx_detection(analyzer, monkeypatch, case):
+    """The detector reports the same patterns on the CSR shim as on a DiGraph."""
+    G, metadata = case.build(use_csr=False)
+    G_csr, _ = case.build(use_csr=True)
+
+    detector = getattr(analyzer, case.detector)
+    if case.prepare:
+        case.prepare(detector, metadata, monkeypatch)
+
+    expected = {p['pattern_id']: p for p in detector.detect(G)}
+    if case.prepare_csr:
+        case.prepare_csr(detector, monkeypatch)
+    actual = {p['pattern_id']: p for p in detector.detect(G_csr)}
+
+    assert expected and actual.keys() == expected.keys()
+    for pattern_id, pattern in expected.items():
+        for field in case.exact_fields:
+            assert actual[pattern_id][field] == pattern[field], field
+        for field in case.approx_fields:
+            assert actual[pattern_id][field] == pytest.approx(pattern[field]), field
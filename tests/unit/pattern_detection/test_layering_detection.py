@@ -14,12 +14,11 @@ Enhanced with:
 - Dynamic layering path generation for various depths
 - Noise transactions
 - Parametrized tests
-- Debug console output
+- Debug console output (enable with --verbose-pattern-tests)
 """
 
 import pytest
 import time
-import random
 import networkx as nx
 import numpy as np
 from typing import Tuple, List
@@ -27,15 +26,30 @@ from packages.analyzers.structural.structural_pattern_analyzer import Structural
 from packages.storage.repositories.structural_pattern_repository import StructuralPatternRepository
 from packages.storage.repositories.money_flows_repository import MoneyFlowsRepository
 from packages.storage.repositories.address_label_repository import AddressLabelRepository
+from tests.unit.pattern_detection._diagnostics import HASH_RULE, HEAVY_RULE, silent
+from tests.unit.pattern_detection.conftest import wire
 
 
-def generate_layering_path_with_noise(path_depth: int, noise_ratio: float = 0.01) -> Tuple[nx.DiGraph, dict]:
+def _check(condition: bool, ok_msg: str, err_msg: str = None, *, log=silent) -> None:
+    """Assert condition (failing with err_msg or ok_msg) and log ok_msg on success."""
+    assert condition, err_msg or ok_msg
+    log("   ✓ %s", ok_msg)
+
+
+def generate_layering_path_with_noise(
+    path_depth: int,
+    noise_ratio: float = 0.01,
+    seed: int = None,
+    log=None
+) -> Tuple[nx.DiGraph, dict]:
     """
     Generate a layering path with noise transactions.
     
     Args:
         path_depth: Number of hops in the path (3, 4, 5, 6, 8)
         noise_ratio: Ratio of noise transactions to path transactions
+        seed: Generator seed (defaults to one derived from path_depth and noise_ratio)
+        log: Diagnostic printer (silent by default)
     
     Returns:
         Tuple of (graph, metadata) where metadata contains:
@@ -46,9 +60,12 @@ def generate_layering_path_with_noise(path_depth: int, noise_ratio: float = 0.01
             - path_edges: List of (from, to, amount)
             - coefficient_of_variation: Actual CV
     """
-    print(f"\n{'='*80}")
-    print(f"🔧 GENERATING LAYERING PATH: depth={path_depth}, noise_ratio={noise_ratio}")
-    print(f"{'='*80}")
+    log = log or silent
+    log("\n%s", HEAVY_RULE)
+    log("🔧 GENERATING LAYERING PATH: depth=%s, noise_ratio=%s", path_depth, noise_ratio)
+    log("%s", HEAVY_RULE)
+    
+    rng = np.random.default_rng(seed if seed is not None else path_depth * 1000 + int(noise_ratio * 100))
     
     G = nx.DiGraph()
     
@@ -56,61 +73,64 @@ def generate_layering_path_with_noise(path_depth: int, noise_ratio: float = 0.01
     path_nodes = [f"LAYER_{i:04d}" for i in range(path_depth)]
     source = path_nodes[0]
     destination = path_nodes[-1]
-    print(f"📍 Path nodes: {len(path_nodes)} nodes")
-    print(f"   Source: {source}")
-    print(f"   Destination: {destination}")
+    log("📍 Path nodes: %s nodes", len(path_nodes))
+    log("   Source: %s", source)
+    log("   Destination: %s", destination)
     
     # Create layering path edges with consistent amounts (low CV)
     # Use VERY HIGH amounts to ensure high volume percentile filtering includes our path
-    path_edges = []
-    total_path_volume = 0
     base_amount = 500000  # VERY HIGH base amount to pass volume filters
-    amounts = []
+    num_path_edges = len(path_nodes) - 1
     
-    for i in range(len(path_nodes) - 1):
-        from_node = path_nodes[i]
-        to_node = path_nodes[i + 1]
-        
-        # Very consistent amounts (CV < 0.5) - vary by only ±10%
-        amount = base_amount * random.uniform(0.95, 1.05)
-        tx_count = random.randint(1, 3)
-        
-        G.add_edge(from_node, to_node, amount_usd_sum=amount, tx_count=tx_count)
-        path_edges.append((from_node, to_node, amount))
-        total_path_volume += amount
-        amounts.append(amount)
+    # Very consistent amounts (CV < 0.5) - vary by only ±5%
+    amounts = base_amount * rng.uniform(0.95, 1.05, size=num_path_edges)
+    tx_counts = rng.integers(1, 4, size=num_path_edges)
     
-    # Calculate coefficient of variation
-    cv = np.std(amounts) / np.mean(amounts) if amounts else 0
+    path_edges = list(zip(path_nodes[:-1], path_nodes[1:], amounts.tolist()))
+    G.add_edges_from(
+        (from_node, to_node, {'amount_usd_sum': amount, 'tx_count': int(tx_count)})
+        for (from_node, to_node, amount), tx_count in zip(path_edges, tx_counts)
+    )
+    total_path_volume = float(amounts.sum())
     
-    print(f"💰 Path edges: {len(path_edges)} edges, total volume: ${total_path_volume:.2f}")
-    print(f"📊 Coefficient of variation: {cv:.4f} (target: < 0.5)")
+    # Calculate coefficient of variation (population std, as in the detector)
+    cv = float(amounts.std(ddof=0) / amounts.mean()) if num_path_edges else 0.0
+    
+    log("💰 Path edges: %s edges, total volume: $%.2f", len(path_edges), total_path_volume)
+    log("📊 Coefficient of variation: %.4f (target: < 0.5)", cv)
     
     # Calculate noise edges - use VERY LOW ratio to avoid noise creating layering patterns
     num_noise_edges = int(len(path_edges) * noise_ratio)
     noise_edges = []
     
     if num_noise_edges > 0:
-        print(f"🔊 Adding noise: {num_noise_edges} noise edges")
-        noise_nodes = [f"NOISE_{i:04d}" for i in range(max(3, num_noise_edges))]
-        
-        for i in range(num_noise_edges):
-            from_node = random.choice(noise_nodes)
-            to_node = random.choice(noise_nodes)
-            if from_node == to_node:
-                to_node = random.choice(noise_nodes)
-            
-            # Use SMALL varied amounts so noise doesn't pass volume filters
-            amount = 5000 * random.uniform(0.1, 2.0)  # Small amounts for noise
-            G.add_edge(from_node, to_node, amount_usd_sum=amount, tx_count=1)
-            noise_edges.append((from_node, to_node, amount))
+        log("🔊 Adding noise: %s noise edges", num_noise_edges)
+        noise_nodes = np.array([f"NOISE_{i:04d}" for i in range(max(3, num_noise_edges))])
+        
+        # Sample endpoints as integer indices; shift self-loops to the next node
+        pairs = rng.integers(0, len(noise_nodes), size=(num_noise_edges, 2))
+        self_loops = pairs[:, 0] == pairs[:, 1]
+        pairs[self_loops, 1] = (pairs[self_loops, 1] + 1) % len(noise_nodes)
+        
+        # Use SMALL varied amounts so noise doesn't pass volume filters
+        noise_amounts = 5000 * rng.uniform(0.1, 2.0, num_noise_edges)
+        
+        noise_edges = list(zip(
+            noise_nodes[pairs[:, 0]].tolist(),
+            noise_nodes[pairs[:, 1]].tolist(),
+            noise_amounts.tolist()
+        ))
+        G.add_edges_from(
+            (from_node, to_node, {'amount_usd_sum': amount, 'tx_count': 1})
+            for from_node, to_node, amount in noise_edges
+        )
     
-    print(f"📊 Graph stats:")
-    print(f"   Total nodes: {G.number_of_nodes()}")
-    print(f"   Total edges: {G.number_of_edges()}")
-    print(f"   Path nodes: {len(path_nodes)}")
-    print(f"   Path edges: {len(path_edges)}")
-    print(f"   Noise edges: {len(noise_edges)}")
+    log("📊 Graph stats:")
+    log("   Total nodes: %s", G.number_of_nodes())
+    log("   Total edges: %s", G.number_of_edges())
+    log("   Path nodes: %s", len(path_nodes))
+    log("   Path edges: %s", len(path_edges))
+    log("   Noise edges: %s", len(noise_edges))
     
     metadata = {
         'path_nodes': path_nodes,
@@ -126,191 +146,184 @@ def generate_layering_path_with_noise(path_depth: int, noise_ratio: float = 0.01
     return G, metadata
 
 
-def create_simple_layering_path() -> nx.DiGraph:
+def make_path_graph(nodes: List[str], amounts, tx_counts=None) -> nx.DiGraph:
     """
-    Create a simple 4-hop layering path: A → B → C → D → E
-    All edges have consistent $10k amounts.
+    Build a directed chain nodes[0] → nodes[1] → ... in one bulk insert.
+    
+    Args:
+        nodes: Path nodes in order
+        amounts: USD amount per hop (len(nodes) - 1 values)
+        tx_counts: Transaction count per hop (defaults to 1)
     """
+    tx_counts = tx_counts if tx_counts is not None else [1] * (len(nodes) - 1)
     G = nx.DiGraph()
-    nodes = ['A', 'B', 'C', 'D', 'E']
-    base_amount = 10000
-    
-    for i in range(len(nodes) - 1):
-        # Consistent amounts
-        amount = base_amount * random.uniform(0.98, 1.02)
-        G.add_edge(nodes[i], nodes[i + 1], amount_usd_sum=amount, tx_count=2)
+    G.add_edges_from(
+        (from_node, to_node, {'amount_usd_sum': float(amount), 'tx_count': int(tx_count)})
+        for from_node, to_node, amount, tx_count in zip(nodes[:-1], nodes[1:], amounts, tx_counts)
+    )
+    return G
+
+
+def add_low_volume_pairs(G: nx.DiGraph, num_pairs: int, amount: float = 100.0) -> nx.DiGraph:
+    """
+    Add disjoint NOISE_i_SRC → NOISE_i_DST edges carrying a small amount.
     
+    LayeringDetector only starts paths at nodes above its high-volume
+    percentile, so a bare path rarely has two candidates. Padding it with
+    low-volume background pairs lifts the path nodes above the gate.
+    """
+    G.add_edges_from(
+        (f"NOISE_{i:04d}_SRC", f"NOISE_{i:04d}_DST", {'amount_usd_sum': amount, 'tx_count': 1})
+        for i in range(num_pairs)
+    )
     return G
 
 
+def create_simple_layering_path(rng: np.random.Generator = None) -> nx.DiGraph:
+    """
+    Create a simple 4-hop layering path: A → B → C → D → E
+    All edges have consistent $10k amounts.
+    """
+    rng = rng if rng is not None else np.random.default_rng(0)
+    return make_path_graph(['A', 'B', 'C', 'D', 'E'], 10000 * rng.uniform(0.98, 1.02, size=4), [2] * 4)
+
+
 def create_inconsistent_path() -> nx.DiGraph:
     """
     Create a path with high CV - should NOT be detected as layering.
     A → B → C → D with varying amounts
     """
-    G = nx.DiGraph()
-    G.add_edge('A', 'B', amount_usd_sum=10000, tx_count=1)
-    G.add_edge('B', 'C', amount_usd_sum=50000, tx_count=1)  # Big jump
-    G.add_edge('C', 'D', amount_usd_sum=15000, tx_count=1)
-    return G
+    return make_path_graph(['A', 'B', 'C', 'D'], [10000, 50000, 15000])  # Big jump at B → C
 
 
 def create_short_path() -> nx.DiGraph:
     """
     Create a 2-hop path - too short for layering detection.
     """
-    G = nx.DiGraph()
-    G.add_edge('A', 'B', amount_usd_sum=10000, tx_count=1)
-    G.add_edge('B', 'C', amount_usd_sum=10000, tx_count=1)
-    return G
+    return make_path_graph(['A', 'B', 'C'], [10000, 10000])
+
+
+@pytest.fixture(scope="module", params=[3, 4, 5, 6, 8])
+def layering_graph(request, log):
+    """
+    Seeded noisy layering path per depth, built once per module.
+    
+    Detectors only read the graph, so the cached (graph, metadata) tuple
+    is safe to share.
+    """
+    path_depth = request.param
+    # LOW noise to avoid spurious detections
+    return generate_layering_path_with_noise(path_depth, noise_ratio=1, log=log)
 
 
 class TestLayeringDetection:
-    """Test layering path pattern detection."""
+    """
+    Test layering path pattern detection.
     
-    @pytest.fixture
-    def analyzer(self, test_data_context):
-        """Create StructuralPatternAnalyzer instance with mock repos."""
-        from unittest.mock import Mock
-        from packages.utils import calculate_time_window
-        from packages.analyzers.structural import StructuralPatternAnalyzer
-        
-        start_ts, end_ts = calculate_time_window(
-            test_data_context['window_days'],
-            test_data_context['processing_date']
-        )
-        
-        # Create mock repositories
-        mock_money_flows = Mock()
-        mock_pattern_repo = Mock()
-        mock_label_repo = Mock()
-        
-        analyzer = StructuralPatternAnalyzer(
-            money_flows_repository=mock_money_flows,
-            pattern_repository=mock_pattern_repo,
-            address_label_repository=mock_label_repo,
-            window_days=test_data_context['window_days'],
-            start_timestamp=start_ts,
-            end_timestamp=end_ts,
-            network=test_data_context['network']
-        )
-        
-        return analyzer
+    Uses the module-scoped analyzer from conftest; each test points its
+    graph hooks at its own G via wire().
+    """
     
-    @pytest.mark.parametrize("path_depth", [3, 4, 5, 6, 8])
-    def test_dynamic_layering_detection_with_noise(self, analyzer, path_depth):
+    def test_dynamic_layering_detection_with_noise(self, analyzer, log, layering_graph, verbose_pattern_tests):
         """
         Test layering detection with dynamically generated paths of various depths.
         Includes noise transactions.
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Layering Detection - Depth {path_depth}")
-        print(f"{'#'*80}")
+        G, metadata = layering_graph
+        path_depth = metadata['path_depth']
         
-        # Generate layering path with LOW noise to avoid spurious detections
-        G, metadata = generate_layering_path_with_noise(path_depth, noise_ratio=1)
+        log("\n%s", HASH_RULE)
+        log("# TEST: Layering Detection - Depth %s", path_depth)
+        log("%s", HASH_RULE)
         
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
-        
-        # Get layering detector
-        layering_detector = analyzer.layering_detector
+        layering_detector = wire(analyzer, G).layering_detector
         
         # Run detection
-        print(f"\n🔍 Running layering detection...")
-        start_time = time.time()
+        log("\n🔍 Running layering detection...")
+        start = time.perf_counter_ns()
         patterns = layering_detector.detect(G)
-        detection_time = time.time() - start_time
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
         
-        print(f"⏱️  Detection completed in {detection_time:.4f} seconds")
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("⏱️  Detection completed in %.3f ms", elapsed_ms)
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Debug: Print all detected patterns
-        for idx, pattern in enumerate(patterns):
-            print(f"\n  Pattern {idx + 1}:")
-            print(f"    Type: {pattern.get('pattern_type', 'N/A')}")
-            print(f"    Path Depth: {pattern.get('path_depth', 'N/A')}")
-            print(f"    Volume: ${pattern.get('path_volume_usd', 0):.2f}")
-            print(f"    Source: {pattern.get('source_address', 'N/A')}")
-            print(f"    Destination: {pattern.get('destination_address', 'N/A')}")
+        if verbose_pattern_tests:
+            for idx, pattern in enumerate(patterns):
+                log("\n  Pattern %s:", idx + 1)
+                log("    Type: %s", pattern.get('pattern_type', 'N/A'))
+                log("    Path Depth: %s", pattern.get('path_depth', 'N/A'))
+                log("    Volume: $%.2f", pattern.get('path_volume_usd', 0))
+                log("    Source: %s", pattern.get('source_address', 'N/A'))
+                log("    Destination: %s", pattern.get('destination_address', 'N/A'))
             
-            # Print path
-            layering_path = pattern.get('layering_path', [])
-            if layering_path:
-                print(f"    Path ({len(layering_path)} hops):")
-                if len(layering_path) <= 10:
-                    print(f"      {' → '.join(layering_path)}")
-                else:
-                    path_str = ' → '.join(layering_path[:3])
-                    path_str += f" → ... ({len(layering_path) - 6} more) → "
-                    path_str += ' → '.join(layering_path[-3:])
-                    print(f"      {path_str}")
-        
-        print(f"\n✅ Running assertions...")
+                # Print path
+                layering_path = pattern.get('layering_path', [])
+                if layering_path:
+                    log("    Path (%s hops):", len(layering_path))
+                    # Long paths are truncated to head ... tail
+                    if len(layering_path) <= 10:
+                        log("      %s", ' → '.join(layering_path))
+                    else:
+                        log("      %s → ... (%s more) → %s",
+                            ' → '.join(layering_path[:3]), len(layering_path) - 6,
+                            ' → '.join(layering_path[-3:]))
+        
+        log("\n✅ Running assertions...")
         
         # Layering detector filters for high-volume nodes (90th percentile)
         # In small test graphs, this may result in no detections
         if len(patterns) == 0:
-            print(f"   ℹ No patterns detected (volume filtering excluded all paths)")
-            print(f"   ℹ Layering detector requires high-volume nodes (90th percentile)")
-            print(f"   ℹ Test validates detector behavior with volume constraints")
-            print(f"\n{'='*80}")
-            print(f"✅ TEST PASSED: Detector correctly applies volume filtering")
-            print(f"{'='*80}\n")
+            log("   ℹ No patterns detected (volume filtering excluded all paths)")
+            log("   ℹ Layering detector requires high-volume nodes (90th percentile)")
+            log("   ℹ Test validates detector behavior with volume constraints")
+            log("\n%s", HEAVY_RULE)
+            log("✅ TEST PASSED: Detector correctly applies volume filtering")
+            log("%s\n", HEAVY_RULE)
             return  # Skip remaining assertions - expected behavior
         
-        print(f"   ✓ Found {len(patterns)} layering path(s)")
+        log("   ✓ Found %s layering path(s)", len(patterns))
         
         # Take first detected pattern and verify properties
         main_pattern = patterns[0]
         
         # Verify pattern type
-        assert main_pattern['pattern_type'] == 'layering_path'
-        print(f"   ✓ Pattern type is 'layering_path'")
+        _check(main_pattern['pattern_type'] == 'layering_path',
+               "Pattern type is 'layering_path'", log=log)
         
         # Verify path depth is in valid range
         detected_depth = main_pattern['path_depth']
-        assert 3 <= detected_depth <= 8, f"Path depth {detected_depth} out of range [3, 8]"
-        print(f"   ✓ Path depth in valid range: {detected_depth}")
+        _check(3 <= detected_depth <= 8, "Path depth in valid range [3, 8]",
+               f"Path depth {detected_depth} out of range [3, 8]", log=log)
         
         # Verify volume is positive
-        detected_volume = main_pattern['path_volume_usd']
-        assert detected_volume > 0, "Path volume must be positive"
-        print(f"   ✓ Path volume valid: ${detected_volume:.2f}")
+        _check(main_pattern['path_volume_usd'] > 0, "Path volume is positive", log=log)
         
         # Verify address roles match depth
-        assert len(main_pattern['address_roles']) == detected_depth
-        print(f"   ✓ Address roles correctly assigned ({len(main_pattern['address_roles'])} roles)")
+        _check(len(main_pattern['address_roles']) == detected_depth,
+               "Address roles match path depth", log=log)
         
         # Verify required fields
         required_fields = ['pattern_id', 'pattern_hash', 'layering_path', 'addresses_involved']
-        for field in required_fields:
-            assert field in main_pattern, f"Missing required field: {field}"
-        print(f"   ✓ All required fields present")
+        missing = [field for field in required_fields if field not in main_pattern]
+        _check(not missing, "All required fields present", f"Missing required fields: {missing}", log=log)
         
-        print(f"\n{'='*80}")
-        print(f"✅ TEST PASSED: Layering detection with volume filtering")
-        print(f"{'='*80}\n")
+        log("\n%s", HEAVY_RULE)
+        log("✅ TEST PASSED: Layering detection with volume filtering")
+        log("%s\n", HEAVY_RULE)
     
-    def test_layering_detection_basic(self, analyzer):
+    def test_layering_detection_basic(self, analyzer, log):
         """Test basic layering detection with simple 4-hop path."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Basic Layering Detection")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Basic Layering Detection")
+        log("%s", HASH_RULE)
         
         G = create_simple_layering_path()
         
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
-        
-        layering_detector = analyzer.layering_detector
+        layering_detector = wire(analyzer, G).layering_detector
         patterns = layering_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         if len(patterns) > 0:
             pattern = patterns[0]
@@ -318,108 +331,108 @@ class TestLayeringDetection:
             assert pattern['path_depth'] >= 3  # Minimum path length
             assert 'source_address' in pattern
             assert 'destination_address' in pattern
-            print(f"   ✓ Path depth: {pattern['path_depth']}")
-            print(f"   ✓ Volume: ${pattern['path_volume_usd']:.2f}")
+            log("   ✓ Path depth: %s", pattern['path_depth'])
+            log("   ✓ Volume: $%.2f", pattern['path_volume_usd'])
         
-        print(f"✅ TEST PASSED: Basic layering detection")
+        log("✅ TEST PASSED: Basic layering detection")
     
-    def test_layering_path_depth_calculation(self, analyzer):
+    def test_layering_path_depth_calculation(self, analyzer, log):
         """Test that path depth is calculated correctly."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Path Depth Calculation")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Path Depth Calculation")
+        log("%s", HASH_RULE)
         
         # Create path with known depth
-        G = nx.DiGraph()
         nodes = ['A', 'B', 'C', 'D', 'E', 'F']  # 6 nodes = 5 hops = depth 6
         base_amount = 50000
         
-        for i in range(len(nodes) - 1):
-            amount = base_amount * random.uniform(0.98, 1.02)
-            G.add_edge(nodes[i], nodes[i + 1], amount_usd_sum=amount, tx_count=1)
+        rng = np.random.default_rng(len(nodes))
+        G = make_path_graph(nodes, base_amount * rng.uniform(0.98, 1.02, size=len(nodes) - 1))
+        # 56 nodes put the 90th percentile between the pairs and the path,
+        # so all six path nodes are source/target candidates
+        add_low_volume_pairs(G, 25)
         
-        layering_detector = analyzer.layering_detector
+        layering_detector = wire(analyzer, G).layering_detector
         patterns = layering_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
-        if len(patterns) > 0:
-            pattern = patterns[0]
-            expected_depth = len(nodes)
-            assert pattern['path_depth'] == expected_depth, \
-                f"Expected depth {expected_depth}, got {pattern['path_depth']}"
-            print(f"   ✓ Path depth correct: {pattern['path_depth']}")
+        full_paths = [p for p in patterns if p['layering_path'] == nodes]
+        assert len(full_paths) == 1, f"Expected the full A → F path among {len(patterns)} pattern(s)"
+        
+        expected_depth = len(nodes)
+        assert full_paths[0]['path_depth'] == expected_depth, \
+            f"Expected depth {expected_depth}, got {full_paths[0]['path_depth']}"
+        log("   ✓ Path depth correct: %s", full_paths[0]['path_depth'])
         
-        print(f"✅ TEST PASSED: Path depth calculation")
+        log("✅ TEST PASSED: Path depth calculation")
     
-    def test_layering_volume_consistency(self, analyzer):
+    def test_layering_volume_consistency(self, analyzer, log):
         """Test that volume consistency (low CV) is validated."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Volume Consistency Validation")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Volume Consistency Validation")
+        log("%s", HASH_RULE)
         
         # Create consistent path
         G_consistent = create_simple_layering_path()
         
-        layering_detector = analyzer.layering_detector
+        layering_detector = wire(analyzer, G_consistent).layering_detector
         patterns = layering_detector.detect(G_consistent)
         
-        print(f"📋 Consistent path detected {len(patterns)} pattern(s)")
+        log("📋 Consistent path detected %s pattern(s)", len(patterns))
         assert len(patterns) >= 0  # Should detect or not based on other criteria
         
         if len(patterns) > 0:
-            print(f"   ✓ Consistent path detected as layering")
+            log("   ✓ Consistent path detected as layering")
         
-        print(f"✅ TEST PASSED: Volume consistency validation")
+        log("✅ TEST PASSED: Volume consistency validation")
     
-    def test_no_detection_inconsistent_volumes(self, analyzer):
+    def test_no_detection_inconsistent_volumes(self, analyzer, log):
         """Test that paths with high CV are NOT detected."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: No Detection for Inconsistent Volumes")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: No Detection for Inconsistent Volumes")
+        log("%s", HASH_RULE)
         
         G = create_inconsistent_path()
+        # Clear the volume gate so an empty result comes from the CV check
+        add_low_volume_pairs(G, 15)
         
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
-        
-        layering_detector = analyzer.layering_detector
+        layering_detector = wire(analyzer, G).layering_detector
         patterns = layering_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # High CV path should NOT be detected
-        # (or if detected, should have high CV indicating it's not real layering)
-        print(f"   ✓ Inconsistent path handling: {len(patterns)} patterns")
+        assert patterns == [], f"Inconsistent path detected as layering: {len(patterns)} pattern(s)"
+        log("   ✓ Inconsistent path not detected")
         
-        print(f"✅ TEST PASSED: Inconsistent volumes handled")
+        log("✅ TEST PASSED: Inconsistent volumes handled")
     
-    def test_layering_deduplication(self, analyzer):
+    def test_layering_deduplication(self, analyzer, log):
         """Test that same path detected multiple times is deduplicated."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Layering Deduplication")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Layering Deduplication")
+        log("%s", HASH_RULE)
         
-        G = create_simple_layering_path()
+        # Padded so the path clears the volume gate and there are patterns to compare
+        G = add_low_volume_pairs(create_simple_layering_path(), 20)
         
-        layering_detector = analyzer.layering_detector
+        layering_detector = wire(analyzer, G).layering_detector
         
-        # Run detection twice
-        print(f"🔍 Running detection #1...")
+        log("🔍 Running detection #1...")
         patterns1 = layering_detector.detect(G)
-        print(f"   Found {len(patterns1)} pattern(s)")
+        log("   Found %s pattern(s)", len(patterns1))
+        
+        assert patterns1, "Padded layering path should be detected"
         
-        print(f"🔍 Running detection #2...")
-        patterns2 = layering_detector.detect(G)
-        print(f"   Found {len(patterns2)} pattern(s)")
+        log("🔍 Running detection #2 on a copy...")
+        patterns2 = layering_detector.detect(G.copy())
+        log("   Found %s pattern(s)", len(patterns2))
         
         # Should return same patterns
-        if len(patterns1) > 0 and len(patterns2) > 0:
-            assert patterns1[0]['pattern_id'] == patterns2[0]['pattern_id']
-            assert patterns1[0]['pattern_hash'] == patterns2[0]['pattern_hash']
-            print(f"   ✓ Pattern IDs match")
-            print(f"   ✓ Pattern hashes match")
+        _check([p['pattern_id'] for p in patterns1] == [p['pattern_id'] for p in patterns2],
+               "Pattern IDs match", log=log)
+        _check([p['pattern_hash'] for p in patterns1] == [p['pattern_hash'] for p in patterns2],
+               "Pattern hashes match", log=log)
         
-        print(f"✅ TEST PASSED: Deduplication working")
\ No newline at end of file
+        log("✅ TEST PASSED: Deduplication working")
\ No newline at end of file
@@ -14,418 +14,284 @@ Enhanced with:
 - Dynamic motif generation for various sizes
 - Noise transactions
 - Parametrized tests
-- Debug console output
+- Debug console output (enable with --verbose-pattern-tests)
 """
 
 import pytest
+import os
 import time
-import random
+from collections import defaultdict
 import networkx as nx
 from typing import Tuple, List
 from packages.analyzers.structural.structural_pattern_analyzer import StructuralPatternAnalyzer
 from packages.storage.repositories.structural_pattern_repository import StructuralPatternRepository
 from packages.storage.repositories.money_flows_repository import MoneyFlowsRepository
 from packages.storage.repositories.address_label_repository import AddressLabelRepository
+from tests.unit.pattern_detection._csr_digraph import CSRDiGraph
+from tests.unit.pattern_detection._generators import seeded_motif
+from tests.unit.pattern_detection._diagnostics import HASH_RULE, HEAVY_RULE
+from tests.unit.pattern_detection.conftest import wire
 
 
-def generate_fanin_motif_with_noise(num_sources: int, noise_ratio: float = 0.01) -> Tuple[nx.DiGraph, dict]:
+@pytest.fixture(scope="module")
+def motif_detector(analyzer):
+    """The shared analyzer's motif detector, bound once for the module."""
+    return analyzer.motif_detector
+
+
+# Unit runs sweep a smoke size and the largest size; MOTIF_FULL_SWEEP=1
+# (set by the nightly workflow) restores the intermediate and larger sizes.
+_SWEEP_SIZES = (
+    [5, 10, 20, 50, 100, 500] if os.environ.get("MOTIF_FULL_SWEEP") == "1" else [5, 50]
+)
+
+
+def _composite_motif_graph(kind: str, sizes: List[int], noise_ratio: float) -> Tuple[nx.DiGraph, dict]:
     """
-    Generate a fan-in motif pattern with noise transactions.
+    Disjoint union of one noisy motif per size.
     
-    Args:
-        num_sources: Number of source nodes sending to center (5, 10, 20, 50)
-        noise_ratio: Ratio of noise transactions to motif transactions
-    
-    Returns:
-        Tuple of (graph, metadata) where metadata contains:
-            - center_address: The aggregation point
-            - source_addresses: List of source nodes
-            - fanin_volume: Total incoming volume
-            - in_degree: Number of sources
-            - noise_edges: List of noise edges
+    Every node name is suffixed with its motif's size so the graphs cannot
+    share nodes. Returns the union and per-size metadata whose
+    ``center_address`` carries the same suffix.
     """
-    print(f"\n{'='*80}")
-    print(f"🔧 GENERATING FAN-IN MOTIF: sources={num_sources}, noise_ratio={noise_ratio}")
-    print(f"{'='*80}")
-    
-    G = nx.DiGraph()
-    
-    # Generate center and source nodes
-    center = "CENTER_FANIN"
-    sources = [f"SOURCE_{i:04d}" for i in range(num_sources)]
-    print(f"📍 Center: {center}")
-    print(f"📍 Sources: {len(sources)} nodes")
-    
-    # Create fan-in edges
-    total_fanin_volume = 0
-    base_amount = 10000  # Base amount in USD
-    
-    for source in sources:
-        amount = base_amount * random.uniform(0.8, 1.2)
-        tx_count = random.randint(1, 3)
-        G.add_edge(source, center, amount_usd_sum=amount, tx_count=tx_count)
-        total_fanin_volume += amount
-    
-    print(f"💰 Fan-in edges: {len(sources)} edges, total volume: ${total_fanin_volume:.2f}")
-    
-    # Add minimal outgoing edges from center (to avoid fan-out detection)
-    G.add_edge(center, "OUTPUT_1", amount_usd_sum=5000, tx_count=1)
-    
-    # Calculate noise edges
-    num_noise_edges = int(len(sources) * noise_ratio)
-    noise_edges = []
-    
-    if num_noise_edges > 0:
-        print(f"🔊 Adding noise: {num_noise_edges} noise edges")
-        noise_nodes = [f"NOISE_{i:04d}" for i in range(max(2, num_noise_edges))]
-        
-        for i in range(num_noise_edges):
-            from_node = random.choice(noise_nodes)
-            to_node = random.choice(noise_nodes)
-            if from_node == to_node:
-                to_node = random.choice(noise_nodes + sources[:2])
-            
-            amount = base_amount * random.uniform(0.1, 0.5)
-            G.add_edge(from_node, to_node, amount_usd_sum=amount, tx_count=1)
-            noise_edges.append((from_node, to_node, amount))
-    
-    print(f"📊 Graph stats:")
-    print(f"   Total nodes: {G.number_of_nodes()}")
-    print(f"   Total edges: {G.number_of_edges()}")
-    print(f"   Center in-degree: {G.in_degree(center)}")
-    print(f"   Center out-degree: {G.out_degree(center)}")
-    
-    metadata = {
-        'center_address': center,
-        'source_addresses': sources,
-        'fanin_volume': total_fanin_volume,
-        'in_degree': len(sources),
-        'noise_edges': noise_edges,
-        'num_sources': num_sources
-    }
-    
-    return G, metadata
+    graphs, metadata = [], {}
+    for n in sizes:
+        G, meta = seeded_motif(kind, n, noise_ratio)
+        graphs.append(nx.relabel_nodes(G, lambda v, n=n: f"{v}_{n}"))
+        metadata[n] = dict(meta, center_address=f"{meta['center_address']}_{n}")
+    return nx.compose_all(graphs), metadata
+
 
+def _bucket(patterns: List[dict]) -> defaultdict:
+    """Group patterns by ``motif_type`` in a single pass."""
+    buckets = defaultdict(list)
+    for pattern in patterns:
+        buckets[pattern.get('motif_type')].append(pattern)
+    return buckets
 
-def generate_fanout_motif_with_noise(num_destinations: int, noise_ratio: float = 0.01) -> Tuple[nx.DiGraph, dict]:
+
+def _detect_sweep(analyzer, motif_detector, kind: str, log, verbose: bool) -> Tuple[defaultdict, dict]:
     """
-    Generate a fan-out motif pattern with noise transactions.
-    
-    Args:
-        num_destinations: Number of destination nodes receiving from center
-        noise_ratio: Ratio of noise transactions to motif transactions
+    Run the motif detector once over the composite graph for every sweep size.
     
-    Returns:
-        Tuple of (graph, metadata) where metadata contains:
-            - center_address: The distribution point
-            - destination_addresses: List of destination nodes
-            - fanout_volume: Total outgoing volume
-            - out_degree: Number of destinations
-            - noise_edges: List of noise edges
+    The analyzer's graph hooks are wired to the graph first. Returns the
+    detected patterns bucketed by ``motif_type`` and the per-size metadata.
     """
-    print(f"\n{'='*80}")
-    print(f"🔧 GENERATING FAN-OUT MOTIF: destinations={num_destinations}, noise_ratio={noise_ratio}")
-    print(f"{'='*80}")
-    
-    G = nx.DiGraph()
-    
-    # Generate center and destination nodes
-    center = "CENTER_FANOUT"
-    destinations = [f"DEST_{i:04d}" for i in range(num_destinations)]
-    print(f"📍 Center: {center}")
-    print(f"📍 Destinations: {len(destinations)} nodes")
-    
-    # Create fan-out edges
-    total_fanout_volume = 0
-    base_amount = 10000  # Base amount in USD
+    G, metadata = _composite_motif_graph(kind, _SWEEP_SIZES, 10)
+    wire(analyzer, G)
     
-    for dest in destinations:
-        amount = base_amount * random.uniform(0.8, 1.2)
-        tx_count = random.randint(1, 3)
-        G.add_edge(center, dest, amount_usd_sum=amount, tx_count=tx_count)
-        total_fanout_volume += amount
+    # Run detection
+    log("\n🔍 Running motif detection over sizes %s...", _SWEEP_SIZES)
+    start_time = time.time()
+    patterns = motif_detector.detect(G)
+    detection_time = time.time() - start_time
     
-    print(f"💰 Fan-out edges: {len(destinations)} edges, total volume: ${total_fanout_volume:.2f}")
+    log("⏱️  Detection completed in %.4f seconds", detection_time)
+    log("📋 Detected %s pattern(s)", len(patterns))
     
-    # Add minimal incoming edges to center (to avoid fan-in detection)
-    G.add_edge("INPUT_1", center, amount_usd_sum=5000, tx_count=1)
-    
-    # Calculate noise edges
-    num_noise_edges = int(len(destinations) * noise_ratio)
-    noise_edges = []
-    
-    if num_noise_edges > 0:
-        print(f"🔊 Adding noise: {num_noise_edges} noise edges")
-        noise_nodes = [f"NOISE_{i:04d}" for i in range(max(2, num_noise_edges))]
-        
-        for i in range(num_noise_edges):
-            from_node = random.choice(noise_nodes)
-            to_node = random.choice(noise_nodes)
-            if from_node == to_node:
-                to_node = random.choice(noise_nodes + destinations[:2])
-            
-            amount = base_amount * random.uniform(0.1, 0.5)
-            G.add_edge(from_node, to_node, amount_usd_sum=amount, tx_count=1)
-            noise_edges.append((from_node, to_node, amount))
-    
-    print(f"📊 Graph stats:")
-    print(f"   Total nodes: {G.number_of_nodes()}")
-    print(f"   Total edges: {G.number_of_edges()}")
-    print(f"   Center in-degree: {G.in_degree(center)}")
-    print(f"   Center out-degree: {G.out_degree(center)}")
-    
-    metadata = {
-        'center_address': center,
-        'destination_addresses': destinations,
-        'fanout_volume': total_fanout_volume,
-        'out_degree': len(destinations),
-        'noise_edges': noise_edges,
-        'num_destinations': num_destinations
-    }
-    
-    return G, metadata
+    # Debug: Print all detected patterns
+    if verbose:
+        for idx, pattern in enumerate(patterns):
+            log("\n  Pattern %s:", idx + 1)
+            log("    Type: %s", pattern.get('pattern_type', 'N/A'))
+            log("    Motif Type: %s", pattern.get('motif_type', 'N/A'))
+            log("    Center: %s", pattern.get('motif_center_address', 'N/A'))
+            log("    Participants: %s", pattern.get('motif_participant_count', 'N/A'))
+            log("    Volume: $%.2f", pattern.get('evidence_volume_usd', 0))
+    
+    return _bucket(patterns), metadata
 
 
-def create_simple_fanin_graph() -> nx.DiGraph:
+def create_simple_fanin_graph() -> CSRDiGraph:
     """
     Create a simple fan-in: 5 sources → 1 center
     """
-    G = nx.DiGraph()
-    center = 'CENTER'
-    for i in range(5):
-        source = f'SOURCE_{i}'
-        G.add_edge(source, center, amount_usd_sum=10000, tx_count=2)
-    # Minimal outgoing
-    G.add_edge(center, 'OUTPUT', amount_usd_sum=5000, tx_count=1)
-    return G
+    return CSRDiGraph.from_edge_list(
+        [(f'SOURCE_{i}', 'CENTER', 10000, 2) for i in range(5)]
+        # Minimal outgoing
+        + [('CENTER', 'OUTPUT', 5000, 1)]
+    )
 
 
-def create_simple_fanout_graph() -> nx.DiGraph:
+def create_simple_fanout_graph() -> CSRDiGraph:
     """
     Create a simple fan-out: 1 center → 5 destinations
     """
-    G = nx.DiGraph()
-    center = 'CENTER'
-    # Minimal incoming
-    G.add_edge('INPUT', center, amount_usd_sum=5000, tx_count=1)
-    for i in range(5):
-        dest = f'DEST_{i}'
-        G.add_edge(center, dest, amount_usd_sum=10000, tx_count=2)
-    return G
+    return CSRDiGraph.from_edge_list(
+        # Minimal incoming
+        [('INPUT', 'CENTER', 5000, 1)]
+        + [('CENTER', f'DEST_{i}', 10000, 2) for i in range(5)]
+    )
 
 
 class TestMotifDetection:
-    """Test motif pattern detection (fan-in and fan-out)."""
+    """
+    Test motif pattern detection (fan-in and fan-out).
     
-    @pytest.fixture
-    def analyzer(self, test_data_context):
-        """Create StructuralPatternAnalyzer instance with mock repos."""
-        from unittest.mock import Mock
-        from packages.utils import calculate_time_window
-        from packages.analyzers.structural import StructuralPatternAnalyzer
-        
-        start_ts, end_ts = calculate_time_window(
-            test_data_context['window_days'],
-            test_data_context['processing_date']
-        )
-        
-        # Create mock repositories
-        mock_money_flows = Mock()
-        mock_pattern_repo = Mock()
-        mock_label_repo = Mock()
-        
-        analyzer = StructuralPatternAnalyzer(
-            money_flows_repository=mock_money_flows,
-            pattern_repository=mock_pattern_repo,
-            address_label_repository=mock_label_repo,
-            window_days=test_data_context['window_days'],
-            start_timestamp=start_ts,
-            end_timestamp=end_ts,
-            network=test_data_context['network']
-        )
-        
-        return analyzer
+    Uses the module-scoped ``analyzer`` from conftest; ``wire`` swaps in
+    each graph, so one analyzer serves every test in the module.
+    """
+    
+    @pytest.fixture(scope="class")
+    def fanin_sweep(self, analyzer, motif_detector, log, verbose_pattern_tests):
+        """Fan-in patterns (by motif type) detected once over every sweep size, plus per-size metadata."""
+        return _detect_sweep(analyzer, motif_detector, "in", log, verbose_pattern_tests)
+    
+    @pytest.fixture(scope="class")
+    def fanout_sweep(self, analyzer, motif_detector, log, verbose_pattern_tests):
+        """Fan-out patterns (by motif type) detected once over every sweep size, plus per-size metadata."""
+        return _detect_sweep(analyzer, motif_detector, "out", log, verbose_pattern_tests)
+    
+    @pytest.fixture(scope="class")
+    def simple_fanin_patterns(self, analyzer, motif_detector):
+        """Patterns detected once on the simple fan-in graph (detect() only reads G)."""
+        G = create_simple_fanin_graph()
+        wire(analyzer, G)
+        return motif_detector.detect(G)
+    
+    @pytest.fixture(scope="class")
+    def simple_fanout_patterns(self, analyzer, motif_detector):
+        """Patterns detected once on the simple fan-out graph (detect() only reads G)."""
+        G = create_simple_fanout_graph()
+        wire(analyzer, G)
+        return motif_detector.detect(G)
     
-    @pytest.mark.parametrize("num_sources", [5, 10, 20, 50])
-    def test_dynamic_fanin_detection_with_noise(self, analyzer, num_sources):
+    @pytest.mark.parametrize("num_sources", _SWEEP_SIZES)
+    def test_dynamic_fanin_detection_with_noise(self, fanin_sweep, log, num_sources):
         """
         Test fan-in detection with dynamically generated motifs of various sizes.
-        Includes noise transactions.
-        """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Fan-In Detection - {num_sources} sources")
-        print(f"{'#'*80}")
+        Includes noise transactions. All sizes share one detect() call over
+        their disjoint union; each case checks the motif centred on its own
+        size-tagged center.
         
-        # Generate fan-in with noise
-        G, metadata = generate_fanin_motif_with_noise(num_sources, noise_ratio=10)
-        
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
-        
-        # Get motif detector
-        motif_detector = analyzer.motif_detector
-        
-        # Run detection
-        print(f"\n🔍 Running motif detection...")
-        start_time = time.time()
-        patterns = motif_detector.detect(G)
-        detection_time = time.time() - start_time
-        
-        print(f"⏱️  Detection completed in {detection_time:.4f} seconds")
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        By default this is a smoke size (5) plus the largest size (50); the
+        nightly run sets MOTIF_FULL_SWEEP=1 to cover 5-500 sources.
+        """
+        log("\n%s", HASH_RULE)
+        log("# TEST: Fan-In Detection - %s sources", num_sources)
+        log("%s", HASH_RULE)
         
-        # Debug: Print all detected patterns
-        for idx, pattern in enumerate(patterns):
-            print(f"\n  Pattern {idx + 1}:")
-            print(f"    Type: {pattern.get('pattern_type', 'N/A')}")
-            print(f"    Motif Type: {pattern.get('motif_type', 'N/A')}")
-            print(f"    Center: {pattern.get('motif_center_address', 'N/A')}")
-            print(f"    Participants: {pattern.get('motif_participant_count', 'N/A')}")
-            print(f"    Volume: ${pattern.get('evidence_volume_usd', 0):.2f}")
+        buckets, sweep_metadata = fanin_sweep
+        metadata = sweep_metadata[num_sources]
         
         # Find fan-in pattern
-        fanin_patterns = [p for p in patterns if p.get('motif_type') == 'fanin']
+        fanin_patterns = [
+            p for p in buckets['fanin']
+            if p['motif_center_address'] == metadata['center_address']
+        ]
         
-        print(f"\n✅ Running assertions...")
+        log("\n✅ Running assertions...")
         assert len(fanin_patterns) >= 1, f"Expected at least 1 fan-in pattern, found {len(fanin_patterns)}"
-        print(f"   ✓ Found fan-in pattern")
+        log("   ✓ Found fan-in pattern")
         
         # Verify main fan-in pattern
         pattern = fanin_patterns[0]
         
         assert pattern['pattern_type'] == 'motif_fanin'
-        print(f"   ✓ Pattern type is 'motif_fanin'")
+        log("   ✓ Pattern type is 'motif_fanin'")
         
         assert pattern['motif_type'] == 'fanin'
-        print(f"   ✓ Motif type is 'fanin'")
+        log("   ✓ Motif type is 'fanin'")
         
         assert pattern['motif_center_address'] == metadata['center_address']
-        print(f"   ✓ Center address identified correctly")
+        log("   ✓ Center address identified correctly")
         
         # Verify addresses involved
         assert metadata['center_address'] in pattern['addresses_involved']
-        print(f"   ✓ Center address in addresses_involved")
+        log("   ✓ Center address in addresses_involved")
         
         # Verify address roles
         assert 'center' in pattern['address_roles']
         assert 'source' in pattern['address_roles']
-        print(f"   ✓ Address roles correctly assigned")
+        log("   ✓ Address roles correctly assigned")
         
         # Verify volume
         expected_volume = metadata['fanin_volume']
         detected_volume = pattern['evidence_volume_usd']
-        volume_tolerance = expected_volume * 0.15  # 15% tolerance
+        volume_tolerance = expected_volume * 0.01  # 1% tolerance (graphs are seeded)
         
         assert abs(detected_volume - expected_volume) <= volume_tolerance, \
             f"Volume mismatch. Expected ~${expected_volume:.2f}, got ${detected_volume:.2f}"
-        print(f"   ✓ Fan-in volume accurate: ${detected_volume:.2f}")
+        log("   ✓ Fan-in volume accurate: $%.2f", detected_volume)
         
-        print(f"\n{'='*80}")
-        print(f"✅ TEST PASSED: Fan-in with {num_sources} sources")
-        print(f"{'='*80}\n")
+        log("\n%s", HEAVY_RULE)
+        log("✅ TEST PASSED: Fan-in with %s sources", num_sources)
+        log("%s\n", HEAVY_RULE)
     
-    @pytest.mark.parametrize("num_destinations", [5, 10, 20, 50])
-    def test_dynamic_fanout_detection_with_noise(self, analyzer, num_destinations):
+    @pytest.mark.parametrize("num_destinations", _SWEEP_SIZES)
+    def test_dynamic_fanout_detection_with_noise(self, fanout_sweep, log, num_destinations):
         """
         Test fan-out detection with dynamically generated motifs of various sizes.
-        Includes noise transactions.
-        """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Fan-Out Detection - {num_destinations} destinations")
-        print(f"{'#'*80}")
+        Includes noise transactions. All sizes share one detect() call over
+        their disjoint union; each case checks the motif centred on its own
+        size-tagged center.
         
-        # Generate fan-out with noise
-        G, metadata = generate_fanout_motif_with_noise(num_destinations, noise_ratio=10)
-        
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
-        
-        # Get motif detector
-        motif_detector = analyzer.motif_detector
-        
-        # Run detection
-        print(f"\n🔍 Running motif detection...")
-        start_time = time.time()
-        patterns = motif_detector.detect(G)
-        detection_time = time.time() - start_time
-        
-        print(f"⏱️  Detection completed in {detection_time:.4f} seconds")
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        By default this is a smoke size (5) plus the largest size (50); the
+        nightly run sets MOTIF_FULL_SWEEP=1 to cover 5-500 destinations.
+        """
+        log("\n%s", HASH_RULE)
+        log("# TEST: Fan-Out Detection - %s destinations", num_destinations)
+        log("%s", HASH_RULE)
         
-        # Debug: Print all detected patterns
-        for idx, pattern in enumerate(patterns):
-            print(f"\n  Pattern {idx + 1}:")
-            print(f"    Type: {pattern.get('pattern_type', 'N/A')}")
-            print(f"    Motif Type: {pattern.get('motif_type', 'N/A')}")
-            print(f"    Center: {pattern.get('motif_center_address', 'N/A')}")
-            print(f"    Participants: {pattern.get('motif_participant_count', 'N/A')}")
-            print(f"    Volume: ${pattern.get('evidence_volume_usd', 0):.2f}")
+        buckets, sweep_metadata = fanout_sweep
+        metadata = sweep_metadata[num_destinations]
         
         # Find fan-out pattern
-        fanout_patterns = [p for p in patterns if p.get('motif_type') == 'fanout']
+        fanout_patterns = [
+            p for p in buckets['fanout']
+            if p['motif_center_address'] == metadata['center_address']
+        ]
         
-        print(f"\n✅ Running assertions...")
+        log("\n✅ Running assertions...")
         assert len(fanout_patterns) >= 1, f"Expected at least 1 fan-out pattern, found {len(fanout_patterns)}"
-        print(f"   ✓ Found fan-out pattern")
+        log("   ✓ Found fan-out pattern")
         
         # Verify main fan-out pattern
         pattern = fanout_patterns[0]
         
         assert pattern['pattern_type'] == 'motif_fanout'
-        print(f"   ✓ Pattern type is 'motif_fanout'")
+        log("   ✓ Pattern type is 'motif_fanout'")
         
         assert pattern['motif_type'] == 'fanout'
-        print(f"   ✓ Motif type is 'fanout'")
+        log("   ✓ Motif type is 'fanout'")
         
         assert pattern['motif_center_address'] == metadata['center_address']
-        print(f"   ✓ Center address identified correctly")
+        log("   ✓ Center address identified correctly")
         
         # Verify addresses involved
         assert metadata['center_address'] in pattern['addresses_involved']
-        print(f"   ✓ Center address in addresses_involved")
+        log("   ✓ Center address in addresses_involved")
         
         # Verify address roles
         assert 'center' in pattern['address_roles']
         assert 'destination' in pattern['address_roles']
-        print(f"   ✓ Address roles correctly assigned")
+        log("   ✓ Address roles correctly assigned")
         
         # Verify volume
         expected_volume = metadata['fanout_volume']
         detected_volume = pattern['evidence_volume_usd']
-        volume_tolerance = expected_volume * 0.15  # 15% tolerance
+        volume_tolerance = expected_volume * 0.01  # 1% tolerance (graphs are seeded)
         
         assert abs(detected_volume - expected_volume) <= volume_tolerance, \
             f"Volume mismatch. Expected ~${expected_volume:.2f}, got ${detected_volume:.2f}"
-        print(f"   ✓ Fan-out volume accurate: ${detected_volume:.2f}")
+        log("   ✓ Fan-out volume accurate: $%.2f", detected_volume)
         
-        print(f"\n{'='*80}")
-        print(f"✅ TEST PASSED: Fan-out with {num_destinations} destinations")
-        print(f"{'='*80}\n")
+        log("\n%s", HEAVY_RULE)
+        log("✅ TEST PASSED: Fan-out with %s destinations", num_destinations)
+        log("%s\n", HEAVY_RULE)
     
-    def test_fanin_detection_basic(self, analyzer):
+    def test_fanin_detection_basic(self, simple_fanin_patterns, log):
         """Test basic fan-in detection with simple pattern."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Basic Fan-In Detection")
-        print(f"{'#'*80}")
-        
-        G = create_simple_fanin_graph()
-        
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
+        log("\n%s", HASH_RULE)
+        log("# TEST: Basic Fan-In Detection")
+        log("%s", HASH_RULE)
         
-        motif_detector = analyzer.motif_detector
-        patterns = motif_detector.detect(G)
+        patterns = simple_fanin_patterns
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Find fan-in patterns
-        fanin_patterns = [p for p in patterns if p.get('motif_type') == 'fanin']
+        fanin_patterns = _bucket(patterns)['fanin']
         assert len(fanin_patterns) >= 1, "Should detect fan-in pattern"
         
         pattern = fanin_patterns[0]
@@ -433,28 +299,20 @@ class TestMotifDetection:
         assert pattern['motif_center_address'] == 'CENTER'
         assert 'center' in pattern['address_roles']
         
-        print(f"✅ TEST PASSED: Basic fan-in detection")
+        log("✅ TEST PASSED: Basic fan-in detection")
     
-    def test_fanout_detection_basic(self, analyzer):
+    def test_fanout_detection_basic(self, simple_fanout_patterns, log):
         """Test basic fan-out detection with simple pattern."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Basic Fan-Out Detection")
-        print(f"{'#'*80}")
-        
-        G = create_simple_fanout_graph()
+        log("\n%s", HASH_RULE)
+        log("# TEST: Basic Fan-Out Detection")
+        log("%s", HASH_RULE)
         
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
+        patterns = simple_fanout_patterns
         
-        motif_detector = analyzer.motif_detector
-        patterns = motif_detector.detect(G)
-        
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Find fan-out patterns
-        fanout_patterns = [p for p in patterns if p.get('motif_type') == 'fanout']
+        fanout_patterns = _bucket(patterns)['fanout']
         assert len(fanout_patterns) >= 1, "Should detect fan-out pattern"
         
         pattern = fanout_patterns[0]
@@ -462,32 +320,24 @@ class TestMotifDetection:
         assert pattern['motif_center_address'] == 'CENTER'
         assert 'center' in pattern['address_roles']
         
-        print(f"✅ TEST PASSED: Basic fan-out detection")
+        log("✅ TEST PASSED: Basic fan-out detection")
     
-    def test_motif_center_identification(self, analyzer):
+    def test_motif_center_identification(self, simple_fanin_patterns, simple_fanout_patterns, log):
         """Test that center addresses are correctly identified."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Center Address Identification")
-        print(f"{'#'*80}")
-        
-        # Create both patterns
-        G_fanin = create_simple_fanin_graph()
-        G_fanout = create_simple_fanout_graph()
-        
-        motif_detector = analyzer.motif_detector
+        log("\n%s", HASH_RULE)
+        log("# TEST: Center Address Identification")
+        log("%s", HASH_RULE)
         
         # Test fan-in
-        patterns_in = motif_detector.detect(G_fanin)
-        fanin = [p for p in patterns_in if p.get('motif_type') == 'fanin']
+        fanin = _bucket(simple_fanin_patterns)['fanin']
         if fanin:
             assert fanin[0]['motif_center_address'] == 'CENTER'
-            print(f"   ✓ Fan-in center correctly identified")
+            log("   ✓ Fan-in center correctly identified")
         
         # Test fan-out
-        patterns_out = motif_detector.detect(G_fanout)
-        fanout = [p for p in patterns_out if p.get('motif_type') == 'fanout']
+        fanout = _bucket(simple_fanout_patterns)['fanout']
         if fanout:
             assert fanout[0]['motif_center_address'] == 'CENTER'
-            print(f"   ✓ Fan-out center correctly identified")
+            log("   ✓ Fan-out center correctly identified")
         
-        print(f"✅ TEST PASSED: Center identification")
\ No newline at end of file
+        log("✅ TEST PASSED: Center identification")
\ No newline at end of file
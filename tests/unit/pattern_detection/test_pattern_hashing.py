@@ -0,0 +1,37 @@
+"""
+Unit tests for pattern hash generation.
+
+Pattern IDs are persisted and used for deduplication, so the batched
+generate_pattern_hashes must produce exactly the digests of
+generate_pattern_hash.
+"""
+
+from chainswarm_core.constants.patterns import PatternTypes
+from packages.utils.pattern_utils import generate_pattern_hash, generate_pattern_hashes
+
+
+class TestPatternHashing:
+    """Test generate_pattern_hashes against generate_pattern_hash."""
+
+    def test_batched_hashes_match_single_hashes(self):
+        """Each batched digest equals the single-group digest for the same addresses."""
+        groups = [
+            ['ADDR_C', 'ADDR_A', 'ADDR_B'],
+            ['ADDR_B', 'ADDR_A'],
+            ['ADDR_A', 'ADDR_B'],
+            ['ADDR_SOLO'],
+            [],
+        ]
+
+        for pattern_type in (PatternTypes.CYCLE, PatternTypes.LAYERING_PATH):
+            assert generate_pattern_hashes(pattern_type, groups) == [
+                generate_pattern_hash(pattern_type, group) for group in groups
+            ]
+
+    def test_batched_hashes_accept_generators(self):
+        """Address groups may be any iterable, consumed once."""
+        groups = [['ADDR_B', 'ADDR_A'], ['ADDR_SOLO']]
+
+        hashes = generate_pattern_hashes(PatternTypes.CYCLE, (group for group in groups))
+
+        assert hashes == [generate_pattern_hash(PatternTypes.CYCLE, group) for group in groups]
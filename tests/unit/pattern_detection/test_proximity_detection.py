@@ -19,213 +19,113 @@ Enhanced with:
 
 import pytest
 import time
-import random
-import networkx as nx
-from typing import Tuple, List, Dict
+from math import isclose
+import numpy as np
+from dataclasses import dataclass
+from typing import FrozenSet, List, Dict
 from packages.analyzers.structural.structural_pattern_analyzer import StructuralPatternAnalyzer
 from packages.storage.repositories.structural_pattern_repository import StructuralPatternRepository
 from packages.storage.repositories.money_flows_repository import MoneyFlowsRepository
 from packages.storage.repositories.address_label_repository import AddressLabelRepository
+from tests.unit.pattern_detection._csr_digraph import CSRDiGraph
+from tests.unit.pattern_detection._generators import MAX_NOISE_RATIO, generate_proximity_graph_with_noise, seeded_proximity
+from tests.unit.pattern_detection._diagnostics import HASH_RULE, HEAVY_RULE
+from tests.unit.pattern_detection.conftest import wire
 
 
-def generate_proximity_graph_with_noise(
-    max_distance: int,
-    addresses_per_distance: int = 3,
-    noise_ratio: float = 0.01
-) -> Tuple[nx.DiGraph, dict]:
+@dataclass(frozen=True, slots=True)
+class _PatternBatch:
     """
-    Generate a proximity graph with addresses at various distances from risk source.
+    Struct-of-arrays view of detected proximity patterns.
     
-    Args:
-        max_distance: Maximum hops from risk source (3, 4, 5, 6)
-        addresses_per_distance: Number of addresses at each distance level
-        noise_ratio: Ratio of noise transactions
-    
-    Returns:
-        Tuple of (graph, metadata) where metadata contains:
-            - risk_address: The risk source address
-            - addresses_by_distance: Dict[distance -> List[addresses]]
-            - expected_propagation_scores: Dict[address -> score]
-            - total_addresses: Total non-noise addresses
+    Built once per detect() result so assertions run as NumPy reductions
+    instead of per-pattern dict lookups.
     """
-    print(f"\n{'='*80}")
-    print(f"🔧 GENERATING PROXIMITY GRAPH: max_distance={max_distance}, nodes_per_level={addresses_per_distance}")
-    print(f"{'='*80}")
-    
-    G = nx.DiGraph()
-    
-    # Risk source
-    risk_address = "RISK_SOURCE"
-    
-    # Build layered graph: RISK -> D1 -> D2 -> ... -> Dn
-    addresses_by_distance = {}
-    all_risk_addresses = [risk_address]
-    base_amount = 50000
-    
-    # Generate addresses at each distance level
-    previous_level = [risk_address]
-    
-    for distance in range(1, max_distance + 1):
-        current_level = []
-        
-        for i in range(addresses_per_distance):
-            addr = f"DIST_{distance}_ADDR_{i:03d}"
-            current_level.append(addr)
-            
-            # Connect to random node from previous level
-            source = random.choice(previous_level)
-            amount = base_amount * random.uniform(0.8, 1.2)
-            tx_count = random.randint(1, 3)
-            
-            G.add_edge(source, addr, amount_usd_sum=amount, tx_count=tx_count)
-        
-        addresses_by_distance[distance] = current_level
-        previous_level = current_level
-        
-        print(f"📍 Distance {distance}: {len(current_level)} addresses")
-    
-    # Calculate expected propagation scores
-    # Formula: distance_decay_factor / (distance + 1)
-    # Using default decay factor of 1.0
-    expected_propagation_scores = {}
-    decay_factor = 1.0
-    
-    for distance, addrs in addresses_by_distance.items():
-        expected_score = decay_factor / (distance + 1)
-        for addr in addrs:
-            expected_propagation_scores[addr] = expected_score
-    
-    # Total risk-related edges
-    total_edges = sum(len(addrs) for addrs in addresses_by_distance.values())
-    
-    # Add noise edges
-    num_noise_edges = int(total_edges * noise_ratio)
-    noise_edges = []
     
-    if num_noise_edges > 0:
-        print(f"🔊 Adding {num_noise_edges} noise edges")
-        noise_nodes = [f"NOISE_{i:04d}" for i in range(max(3, num_noise_edges))]
-        
-        for i in range(num_noise_edges):
-            from_node = random.choice(noise_nodes)
-            to_node = random.choice(noise_nodes)
-            if from_node == to_node:
-                to_node = random.choice(noise_nodes)
-            
-            amount = base_amount * random.uniform(0.2, 0.8)
-            G.add_edge(from_node, to_node, amount_usd_sum=amount, tx_count=1)
-            noise_edges.append((from_node, to_node))
-    
-    total_addresses = sum(len(addrs) for addrs in addresses_by_distance.values())
-    
-    print(f"📊 Graph stats:")
-    print(f"   Total nodes: {G.number_of_nodes()}")
-    print(f"   Total edges: {G.number_of_edges()}")
-    print(f"   Risk source: {risk_address}")
-    print(f"   Addresses by distance: {total_addresses}")
-    print(f"   Noise edges: {len(noise_edges)}")
+    distance: np.ndarray
+    propagation_score: np.ndarray
+    pattern_id: np.ndarray
+    risk_source: np.ndarray
+    suspect: np.ndarray
+    addresses_involved: List[FrozenSet[str]]
     
-    metadata = {
-        'risk_address': risk_address,
-        'addresses_by_distance': addresses_by_distance,
-        'expected_propagation_scores': expected_propagation_scores,
-        'total_addresses': total_addresses,
-        'max_distance': max_distance,
-        'noise_edges': noise_edges
-    }
+    @classmethod
+    def from_patterns(cls, patterns: List[Dict]) -> '_PatternBatch':
+        n = len(patterns)
+        return cls(
+            distance=np.fromiter((p['distance_to_risk'] for p in patterns), dtype=np.int32, count=n),
+            propagation_score=np.fromiter((p['risk_propagation_score'] for p in patterns), dtype=np.float32, count=n),
+            pattern_id=np.array([p['pattern_id'] for p in patterns], dtype=str),
+            risk_source=np.array([p['risk_source_address'] for p in patterns], dtype=str),
+            suspect=np.array([p['addresses_involved'][1] for p in patterns], dtype=str),
+            addresses_involved=[frozenset(p['addresses_involved']) for p in patterns],
+        )
     
-    return G, metadata
+    def __len__(self) -> int:
+        return len(self.distance)
+
 
 
-def create_simple_proximity_graph() -> nx.DiGraph:
+def create_simple_proximity_graph() -> CSRDiGraph:
     """
     Create a simple proximity graph: RISK → A → B → C
     Distances: A=1, B=2, C=3
     """
-    G = nx.DiGraph()
-    G.add_edge('RISK', 'A', amount_usd_sum=10000, tx_count=2)
-    G.add_edge('A', 'B', amount_usd_sum=8000, tx_count=2)
-    G.add_edge('B', 'C', amount_usd_sum=6000, tx_count=1)
-    return G
+    return CSRDiGraph.from_edge_list([
+        ('RISK', 'A', 10000, 2),
+        ('A', 'B', 8000, 2),
+        ('B', 'C', 6000, 1),
+    ])
 
 
-def create_multi_path_proximity() -> nx.DiGraph:
+def create_multi_path_proximity() -> CSRDiGraph:
     """
     Create graph with multiple paths from risk source.
     """
-    G = nx.DiGraph()
-    # Risk source with 2 paths
-    G.add_edge('RISK', 'A1', amount_usd_sum=10000, tx_count=2)
-    G.add_edge('RISK', 'A2', amount_usd_sum=12000, tx_count=3)
-    
-    # Path 1: RISK -> A1 -> B1 -> C1
-    G.add_edge('A1', 'B1', amount_usd_sum=8000, tx_count=2)
-    G.add_edge('B1', 'C1', amount_usd_sum=6000, tx_count=1)
-    
-    # Path 2: RISK -> A2 -> B2
-    G.add_edge('A2', 'B2', amount_usd_sum=9000, tx_count=2)
-    
-    return G
+    return CSRDiGraph.from_edge_list([
+        # Risk source with 2 paths
+        ('RISK', 'A1', 10000, 2),
+        ('RISK', 'A2', 12000, 3),
+        # Path 1: RISK -> A1 -> B1 -> C1
+        ('A1', 'B1', 8000, 2),
+        ('B1', 'C1', 6000, 1),
+        # Path 2: RISK -> A2 -> B2
+        ('A2', 'B2', 9000, 2),
+    ])
 
 
 class TestProximityDetection:
-    """Test proximity risk pattern detection."""
+    """
+    Test proximity risk pattern detection.
     
-    @pytest.fixture
-    def analyzer(self, test_data_context):
-        """Create StructuralPatternAnalyzer instance with mock repos."""
-        from unittest.mock import Mock
-        from packages.utils import calculate_time_window
-        from packages.analyzers.structural import StructuralPatternAnalyzer
-        
-        start_ts, end_ts = calculate_time_window(
-            test_data_context['window_days'],
-            test_data_context['processing_date']
-        )
-        
-        # Create mock repositories
-        mock_money_flows = Mock()
-        mock_pattern_repo = Mock()
-        mock_label_repo = Mock()
-        
-        analyzer = StructuralPatternAnalyzer(
-            money_flows_repository=mock_money_flows,
-            pattern_repository=mock_pattern_repo,
-            address_label_repository=mock_label_repo,
-            window_days=test_data_context['window_days'],
-            start_timestamp=start_ts,
-            end_timestamp=end_ts,
-            network=test_data_context['network']
-        )
-        
-        # Override max_distance to support extended testing (default is 3)
-        if 'proximity_analysis' in analyzer.config:
-            analyzer.config['proximity_analysis']['max_distance'] = 6
-            print(f"🔧 Overriding max_distance to 6 for testing")
-        
-        return analyzer
+    Uses the module-scoped analyzer from conftest. Tests that look past the
+    configured 3 hops raise max_distance with monkeypatch.
+    """
+    
+    @pytest.fixture(autouse=True)
+    def _reset_risk_hook(self, analyzer):
+        """Drop a test's _identify_risk_addresses override from the shared detector."""
+        yield
+        vars(analyzer.proximity_detector).pop('_identify_risk_addresses', None)
     
     @pytest.mark.parametrize("max_distance", [3, 4, 5, 6])
-    def test_dynamic_proximity_detection_with_noise(self, analyzer, max_distance):
+    def test_dynamic_proximity_detection_with_noise(self, analyzer, monkeypatch, max_distance, log,
+                                                    verbose_pattern_tests):
         """
         Test proximity detection with various distance levels (up to 6 hops).
         Includes noise transactions.
         """
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Proximity Detection - Max Distance {max_distance}")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Proximity Detection - Max Distance %s", max_distance)
+        log("%s", HASH_RULE)
+        
+        # Search as far as the generated levels go (default is 3)
+        monkeypatch.setitem(analyzer.config['proximity_analysis'], 'max_distance', max_distance)
         
         # Generate proximity graph with noise
-        G, metadata = generate_proximity_graph_with_noise(
-            max_distance=max_distance,
-            addresses_per_distance=3,
-            noise_ratio=10
-        )
+        G, metadata = seeded_proximity(max_distance, 3, MAX_NOISE_RATIO, seed=max_distance)
         
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
+        wire(analyzer, G)
         
         # Mock the risk address identification to return our risk source
         def mock_identify_risk(G_param):
@@ -237,65 +137,60 @@ class TestProximityDetection:
         proximity_detector = analyzer.proximity_detector
         
         # Run detection
-        print(f"\n🔍 Running proximity detection...")
+        log("\n🔍 Running proximity detection...")
         start_time = time.time()
         patterns = proximity_detector.detect(G)
         detection_time = time.time() - start_time
+        batch = _PatternBatch.from_patterns(patterns)
         
-        print(f"⏱️  Detection completed in {detection_time:.4f} seconds")
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("⏱️  Detection completed in %.4f seconds", detection_time)
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Debug: Print sample detected patterns
-        patterns_by_distance = {}
-        for pattern in patterns[:10]:  # Show first 10
-            dist = pattern.get('distance_to_risk', 0)
-            if dist not in patterns_by_distance:
-                patterns_by_distance[dist] = []
-            patterns_by_distance[dist].append(pattern)
+        if verbose_pattern_tests:
+            # One pass: each distance, its first pattern and how many share it
+            levels, first, counts = np.unique(batch.distance, return_index=True, return_counts=True)
+            for dist, idx, count in zip(levels.tolist(), first.tolist(), counts.tolist()):
+                log("\n  Distance %s: %s patterns", dist, count)
+                log("    Sample - Propagation Score: %.4f", batch.propagation_score[idx])
         
-        for dist in sorted(patterns_by_distance.keys()):
-            print(f"\n  Distance {dist}: {len([p for p in patterns if p.get('distance_to_risk') == dist])} patterns")
-            sample = patterns_by_distance[dist][0]
-            print(f"    Sample - Propagation Score: {sample.get('risk_propagation_score', 0):.4f}")
-        
-        print(f"\n✅ Running assertions...")
+        log("\n✅ Running assertions...")
         
         # Should detect patterns for addresses at various distances
         assert len(patterns) > 0, "Expected proximity patterns to be detected"
-        print(f"   ✓ Found {len(patterns)} proximity pattern(s)")
+        log("   ✓ Found %s proximity pattern(s)", len(patterns))
         
         # Verify patterns exist for each distance level
-        detected_distances = set(p.get('distance_to_risk', 0) for p in patterns)
-        print(f"   ✓ Detected distances: {sorted(detected_distances)}")
+        detected_distances = np.unique(batch.distance)
+        assert np.array_equal(detected_distances, np.arange(1, max_distance + 1)), \
+            f"Expected distances 1..{max_distance}, got {detected_distances.tolist()}"
+        log("   ✓ Detected distances: %s", detected_distances.tolist())
         
         # Check a sample pattern
         sample_pattern = patterns[0]
         
         # Verify pattern type
         assert sample_pattern['pattern_type'] == 'proximity_risk'
-        print(f"   ✓ Pattern type is 'proximity_risk'")
+        log("   ✓ Pattern type is 'proximity_risk'")
         
         # Verify risk source
-        assert sample_pattern['risk_source_address'] == metadata['risk_address']
-        print(f"   ✓ Risk source identified: {sample_pattern['risk_source_address']}")
-        
-        # Verify distance is within range
-        sample_distance = sample_pattern['distance_to_risk']
-        assert 1 <= sample_distance <= max_distance, \
-            f"Distance {sample_distance} out of range [1, {max_distance}]"
-        print(f"   ✓ Sample distance in valid range: {sample_distance}")
+        assert (batch.risk_source == metadata['risk_address']).all()
+        log("   ✓ Risk source identified: %s", metadata['risk_address'])
         
-        # Verify propagation score formula: decay_factor / (distance + 1)
-        expected_score = 1.0 / (sample_distance + 1)
-        actual_score = sample_pattern['risk_propagation_score']
+        # Verify every distance is within range
+        assert detected_distances.min() >= 1 and detected_distances.max() <= max_distance, \
+            f"Distances {detected_distances.tolist()} out of range [1, {max_distance}]"
+        log("   ✓ All distances in valid range [1, %s]", max_distance)
         
-        assert abs(actual_score - expected_score) < 0.01, \
-            f"Propagation score mismatch. Expected {expected_score:.4f}, got {actual_score:.4f}"
-        print(f"   ✓ Propagation score correct: {actual_score:.4f}")
+        # Verify propagation score formula on every pattern: decay_factor / (distance + 1)
+        expected_scores = np.float32(1.0) / (batch.distance + 1).astype(np.float32)
+        mismatches = np.abs(batch.propagation_score - expected_scores) >= 0.01
+        assert not mismatches.any(), f"Propagation score mismatch on {mismatches.sum()} pattern(s)"
+        log("   ✓ Propagation scores correct for %s pattern(s)", len(batch))
         
         # Verify address roles
         assert sample_pattern['address_roles'] == ['risk_source', 'suspect']
-        print(f"   ✓ Address roles correctly assigned")
+        log("   ✓ Address roles correctly assigned")
         
         # Verify required fields
         required_fields = [
@@ -304,24 +199,27 @@ class TestProximityDetection:
         ]
         for field in required_fields:
             assert field in sample_pattern, f"Missing field: {field}"
-        print(f"   ✓ All required fields present")
+        log("   ✓ All required fields present")
         
-        print(f"\n{'='*80}")
-        print(f"✅ TEST PASSED: Proximity max distance {max_distance}")
-        print(f"{'='*80}\n")
+        log("\n%s", HEAVY_RULE)
+        log("✅ TEST PASSED: Proximity max distance %s", max_distance)
+        log("%s\n", HEAVY_RULE)
     
-    def test_proximity_detection_basic(self, analyzer):
+    @pytest.mark.parametrize("noise_ratio", [-0.5, MAX_NOISE_RATIO + 1])
+    def test_generator_rejects_out_of_range_noise_ratio(self, noise_ratio):
+        """noise_ratio is a per-risk-edge multiplier bounded by MAX_NOISE_RATIO."""
+        with pytest.raises(ValueError, match="noise_ratio"):
+            generate_proximity_graph_with_noise(3, noise_ratio=noise_ratio)
+    
+    def test_proximity_detection_basic(self, analyzer, log):
         """Test basic proximity detection with simple 3-hop path."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Basic Proximity Detection")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Basic Proximity Detection")
+        log("%s", HASH_RULE)
         
         G = create_simple_proximity_graph()
         
-        # Mock the graph building
-        analyzer._build_graph_from_flows_data = lambda flows: G
-        analyzer._extract_addresses_from_flows = lambda flows: list(G.nodes())
-        analyzer._load_address_labels = lambda addrs: None
+        wire(analyzer, G)
         
         # Mock risk identification
         analyzer.proximity_detector._identify_risk_addresses = lambda G_param: ['RISK']
@@ -329,30 +227,30 @@ class TestProximityDetection:
         proximity_detector = analyzer.proximity_detector
         patterns = proximity_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
-        if len(patterns) > 0:
+        batch = _PatternBatch.from_patterns(patterns)
+        if len(batch) > 0:
             # Should find A (dist=1), B (dist=2), C (dist=3)
-            distances = sorted(set(p['distance_to_risk'] for p in patterns))
-            print(f"   Distances found: {distances}")
+            log("   Distances found: %s", np.unique(batch.distance).tolist())
             
             # Check distance 1 pattern
-            dist1_patterns = [p for p in patterns if p['distance_to_risk'] == 1]
-            if dist1_patterns:
-                pattern = dist1_patterns[0]
+            dist1 = np.flatnonzero(batch.distance == 1)
+            if len(dist1):
+                pattern = patterns[dist1[0]]
                 assert pattern['pattern_type'] == 'proximity_risk'
                 assert pattern['risk_source_address'] == 'RISK'
                 expected_score = 1.0 / (1 + 1)  # 0.5
-                assert abs(pattern['risk_propagation_score'] - expected_score) < 0.01
-                print(f"   ✓ Distance 1 pattern correct")
+                assert isclose(pattern['risk_propagation_score'], expected_score, abs_tol=0.01)
+                log("   ✓ Distance 1 pattern correct")
         
-        print(f"✅ TEST PASSED: Basic proximity detection")
+        log("✅ TEST PASSED: Basic proximity detection")
     
-    def test_distance_calculation(self, analyzer):
+    def test_distance_calculation(self, analyzer, log):
         """Test that shortest path distance is calculated correctly."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Distance Calculation")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Distance Calculation")
+        log("%s", HASH_RULE)
         
         G = create_simple_proximity_graph()
         
@@ -362,7 +260,7 @@ class TestProximityDetection:
         proximity_detector = analyzer.proximity_detector
         patterns = proximity_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Expected distances: A=1, B=2, C=3
         expected_distances = {
@@ -371,25 +269,24 @@ class TestProximityDetection:
             'C': 3
         }
         
+        batch = _PatternBatch.from_patterns(patterns)
         for addr, expected_dist in expected_distances.items():
             # Find pattern for this address
-            addr_patterns = [p for p in patterns 
-                           if addr in p.get('addresses_involved', [])]
+            hits = np.flatnonzero(batch.suspect == addr)
             
-            if addr_patterns:
-                pattern = addr_patterns[0]
-                actual_dist = pattern['distance_to_risk']
+            if len(hits):
+                actual_dist = int(batch.distance[hits[0]])
                 assert actual_dist == expected_dist, \
                     f"Distance to {addr}: expected {expected_dist}, got {actual_dist}"
-                print(f"   ✓ Distance to {addr}: {actual_dist}")
+                log("   ✓ Distance to %s: %s", addr, actual_dist)
         
-        print(f"✅ TEST PASSED: Distance calculation")
+        log("✅ TEST PASSED: Distance calculation")
     
-    def test_risk_propagation_score(self, analyzer):
+    def test_risk_propagation_score(self, analyzer, log):
         """Test that risk propagation score uses correct decay formula."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Risk Propagation Score Formula")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Risk Propagation Score Formula")
+        log("%s", HASH_RULE)
         
         G = create_simple_proximity_graph()
         
@@ -399,35 +296,37 @@ class TestProximityDetection:
         proximity_detector = analyzer.proximity_detector
         patterns = proximity_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # decay_factor = 1.0 (default)
         # formula: risk_propagation = decay_factor / (distance + 1)
         
-        for pattern in patterns:
-            distance = pattern['distance_to_risk']
-            actual_score = pattern['risk_propagation_score']
-            expected_score = 1.0 / (distance + 1)
-            
-            assert abs(actual_score - expected_score) < 0.01, \
-                f"Score mismatch at distance {distance}: expected {expected_score:.4f}, got {actual_score:.4f}"
-            
-            print(f"   ✓ Distance {distance}: score = {actual_score:.4f} (expected {expected_score:.4f})")
+        batch = _PatternBatch.from_patterns(patterns)
+        expected_scores = np.float32(1.0) / (batch.distance + 1).astype(np.float32)
+        
+        assert np.allclose(batch.propagation_score, expected_scores, atol=0.01), \
+            f"Score mismatches: {(np.abs(batch.propagation_score - expected_scores) >= 0.01).sum()} pattern(s)"
+        
+        for distance, actual_score, expected_score in zip(
+            batch.distance.tolist(), batch.propagation_score.tolist(), expected_scores.tolist()
+        ):
+            log("   ✓ Distance %s: score = %.4f (expected %.4f)", distance, actual_score, expected_score)
         
-        print(f"✅ TEST PASSED: Propagation score formula")
+        log("✅ TEST PASSED: Propagation score formula")
     
-    def test_multiple_risk_sources(self, analyzer):
+    def test_multiple_risk_sources(self, analyzer, log):
         """Test proximity detection with multiple risk sources."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Multiple Risk Sources")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Multiple Risk Sources")
+        log("%s", HASH_RULE)
         
         # Create graph with 2 risk sources
-        G = nx.DiGraph()
-        G.add_edge('RISK1', 'A', amount_usd_sum=10000, tx_count=2)
-        G.add_edge('A', 'B', amount_usd_sum=8000, tx_count=2)
-        G.add_edge('RISK2', 'C', amount_usd_sum=12000, tx_count=3)
-        G.add_edge('C', 'D', amount_usd_sum=9000, tx_count=2)
+        G = CSRDiGraph.from_edge_list([
+            ('RISK1', 'A', 10000, 2),
+            ('A', 'B', 8000, 2),
+            ('RISK2', 'C', 12000, 3),
+            ('C', 'D', 9000, 2),
+        ])
         
         # Mock risk identification to return both
         analyzer.proximity_detector._identify_risk_addresses = lambda G_param: ['RISK1', 'RISK2']
@@ -435,54 +334,52 @@ class TestProximityDetection:
         proximity_detector = analyzer.proximity_detector
         patterns = proximity_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Should find patterns from both risk sources
-        risk_sources = set(p['risk_source_address'] for p in patterns)
+        risk_sources = set(np.unique(_PatternBatch.from_patterns(patterns).risk_source).tolist())
         
         if len(risk_sources) > 0:
-            print(f"   Risk sources found: {risk_sources}")
-            print(f"   ✓ Multiple risk sources handled")
+            log("   Risk sources found: %s", risk_sources)
+            log("   ✓ Multiple risk sources handled")
         
-        print(f"✅ TEST PASSED: Multiple risk sources")
+        log("✅ TEST PASSED: Multiple risk sources")
     
-    def test_max_distance_cutoff(self, analyzer):
+    def test_max_distance_cutoff(self, analyzer, monkeypatch, log):
         """Test that distances beyond max are not included."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Max Distance Cutoff")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Max Distance Cutoff")
+        log("%s", HASH_RULE)
         
         # Create long chain: RISK -> A -> B -> C -> D -> E -> F -> G (7 hops)
-        G = nx.DiGraph()
         nodes = ['RISK', 'A', 'B', 'C', 'D', 'E', 'F', 'G']
-        for i in range(len(nodes) - 1):
-            G.add_edge(nodes[i], nodes[i + 1], amount_usd_sum=10000, tx_count=1)
+        G = CSRDiGraph.from_edge_list((u, v, 10000, 1) for u, v in zip(nodes, nodes[1:]))
         
         # Mock risk identification
         analyzer.proximity_detector._identify_risk_addresses = lambda G_param: ['RISK']
         
         # Set max_distance to 5
-        analyzer.config['proximity_analysis']['max_distance'] = 5
+        monkeypatch.setitem(analyzer.config['proximity_analysis'], 'max_distance', 5)
         
         proximity_detector = analyzer.proximity_detector
         patterns = proximity_detector.detect(G)
         
-        print(f"📋 Detected {len(patterns)} pattern(s)")
+        log("📋 Detected %s pattern(s)", len(patterns))
         
         # Should only find distances 1-5, not 6 or 7
-        distances = [p['distance_to_risk'] for p in patterns]
-        max_detected = max(distances) if distances else 0
+        distances = _PatternBatch.from_patterns(patterns).distance
+        max_detected = int(distances.max()) if len(distances) else 0
         
         assert max_detected <= 5, f"Found distance {max_detected} > max (5)"
-        print(f"   ✓ Max distance respected: {max_detected} <= 5")
+        log("   ✓ Max distance respected: %s <= 5", max_detected)
         
-        print(f"✅ TEST PASSED: Max distance cutoff")
+        log("✅ TEST PASSED: Max distance cutoff")
     
-    def test_proximity_deduplication(self, analyzer):
+    def test_proximity_deduplication(self, analyzer, log):
         """Test that proximity patterns are deduplicated correctly."""
-        print(f"\n{'#'*80}")
-        print(f"# TEST: Proximity Deduplication")
-        print(f"{'#'*80}")
+        log("\n%s", HASH_RULE)
+        log("# TEST: Proximity Deduplication")
+        log("%s", HASH_RULE)
         
         G = create_simple_proximity_graph()
         
@@ -492,23 +389,26 @@ class TestProximityDetection:
         proximity_detector = analyzer.proximity_detector
         
         # Run detection twice
-        print(f"🔍 Running detection #1...")
+        log("🔍 Running detection #1...")
         patterns1 = proximity_detector.detect(G)
-        print(f"   Found {len(patterns1)} pattern(s)")
+        log("   Found %s pattern(s)", len(patterns1))
         
-        print(f"🔍 Running detection #2...")
+        log("🔍 Running detection #2...")
         patterns2 = proximity_detector.detect(G)
-        print(f"   Found {len(patterns2)} pattern(s)")
+        log("   Found %s pattern(s)", len(patterns2))
         
         # Should return same patterns
         assert len(patterns1) == len(patterns2), "Pattern counts differ"
         
         if len(patterns1) > 0 and len(patterns2) > 0:
-            # Compare pattern IDs and hashes
-            ids1 = sorted([p['pattern_id'] for p in patterns1])
-            ids2 = sorted([p['pattern_id'] for p in patterns2])
+            # Compare pattern IDs and hashes as sets; equal sizes rule out duplicates
+            ids1 = frozenset(p['pattern_id'] for p in patterns1)
+            ids2 = frozenset(p['pattern_id'] for p in patterns2)
+            assert len(ids1) == len(patterns1), "Duplicate pattern IDs in one run"
             assert ids1 == ids2, "Pattern IDs differ"
-            print(f"   ✓ Pattern IDs match")
-            print(f"   ✓ Deduplication working")
+            assert frozenset(p['pattern_hash'] for p in patterns1) == \
+                frozenset(p['pattern_hash'] for p in patterns2), "Pattern hashes differ"
+            log("   ✓ Pattern IDs match")
+            log("   ✓ Deduplication working")
         
-        print(f"✅ TEST PASSED: Deduplication")
\ No newline at end of file
+        log("✅ TEST PASSED: Deduplication")
\ No newline at end of file